@@ -5,8 +5,10 @@ import os
 import sys
 
 from PySide6.QtCore import QTimer
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import QApplication
 
+from slidequest.ui.constants import PIXMAP_CACHE_LIMIT_KB
 from slidequest.views.master_window import MasterWindow
 from slidequest.views.presentation_window import PresentationWindow
 from slidequest.views.launcher import LauncherWindow
@@ -30,6 +32,7 @@ def main() -> None:
             )
         else:
             root_logger.setLevel(resolved_level)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
 
     launcher = LauncherWindow()
     launcher.show()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -30,7 +31,7 @@ LAYOUT_ITEMS: tuple[LayoutItem, ...] = (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class LayoutCell:
     x: float
     y: float
@@ -122,7 +123,13 @@ def _parse_ratio_specs(segment: str) -> list[RatioSpec]:
     return specs
 
 
-def parse_layout_description(layout_description: str) -> list[LayoutCell]:
+@lru_cache(maxsize=256)
+def parse_layout_description(layout_description: str) -> tuple[LayoutCell, ...]:
+    """Parse a layout string into cells; results are memoised and immutable."""
+    return tuple(_parse_layout_cells(layout_description))
+
+
+def _parse_layout_cells(layout_description: str) -> list[LayoutCell]:
     layout_description = layout_description.strip()
     if not layout_description:
         return [LayoutCell(0.0, 0.0, 1.0, 1.0, 1)]
@@ -208,7 +215,7 @@ def parse_layout_description(layout_description: str) -> list[LayoutCell]:
     for idx in auto_indices:
         while candidate in used_ids:
             candidate += 1
-        cells[idx].area_id = candidate
+        cells[idx] = replace(cells[idx], area_id=candidate)
         used_ids.add(candidate)
         candidate += 1
     return cells
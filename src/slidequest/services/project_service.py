@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import glob
 import hashlib
 import json
 import os
 import shutil
 import uuid
 from pathlib import Path
+from threading import Lock
 from typing import Any
 
 try:  # pragma: no cover - Qt is optional in tests
@@ -38,6 +40,8 @@ class ProjectStorageService:
         resolved_id = project_id or remembered or "default"
         self._project_id = resolved_id
         self._project_payload: dict[str, Any] | None = None
+        # Serialises the index/copy/save part of import_file for concurrent importers.
+        self._import_lock = Lock()
         ProjectStorageService._active_project_dir = self.project_dir
         self._save_last_project_id(self._project_id)
 
@@ -141,44 +145,45 @@ class ProjectStorageService:
         source_path = Path(source)
         if not source_path.exists():
             raise FileNotFoundError(source)
-        project = self.load_project()
-        file_index: dict[str, Any] = project.setdefault("files", {})
-
+        # Hashing is the expensive part and runs outside the lock so parallel imports overlap.
         digest, size = self._hash_file(source_path)
-        if deduplicate:
-            for info in file_index.values():
-                if info.get("hash") == digest and info.get("size") == size and info.get("kind") == kind:
-                    return info.get("path", "")
-
-            restored_path = self.restore_from_trash(kind, digest, size)
-            if restored_path:
-                file_id = uuid.uuid4().hex
-                file_index[file_id] = {
-                    "kind": kind,
-                    "path": restored_path,
-                    "hash": digest,
-                    "size": size,
-                    "original_name": source_path.name,
-                }
-                self.save_project(project)
-                return restored_path
-
-        file_id = uuid.uuid4().hex
-        extension = source_path.suffix.lower()
-        relative_path = Path(kind) / f"{file_id}{extension}"
-        target = self.project_dir / relative_path
-        target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source_path, target)
-
-        file_index[file_id] = {
-            "kind": kind,
-            "path": relative_path.as_posix(),
-            "hash": digest,
-            "size": size,
-            "original_name": source_path.name,
-        }
-        self.save_project(project)
-        return relative_path.as_posix()
+        with self._import_lock:
+            project = self.load_project()
+            file_index: dict[str, Any] = project.setdefault("files", {})
+            if deduplicate:
+                for info in file_index.values():
+                    if info.get("hash") == digest and info.get("size") == size and info.get("kind") == kind:
+                        return info.get("path", "")
+
+                restored_path = self.restore_from_trash(kind, digest, size)
+                if restored_path:
+                    file_id = uuid.uuid4().hex
+                    file_index[file_id] = {
+                        "kind": kind,
+                        "path": restored_path,
+                        "hash": digest,
+                        "size": size,
+                        "original_name": source_path.name,
+                    }
+                    self.save_project(project)
+                    return restored_path
+
+            file_id = uuid.uuid4().hex
+            extension = source_path.suffix.lower()
+            relative_path = Path(kind) / f"{file_id}{extension}"
+            target = self.project_dir / relative_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source_path, target)
+
+            file_index[file_id] = {
+                "kind": kind,
+                "path": relative_path.as_posix(),
+                "hash": digest,
+                "size": size,
+                "original_name": source_path.name,
+            }
+            self.save_project(project)
+            return relative_path.as_posix()
 
     def set_note_title(self, relative_path: str, title: str) -> None:
         project = self.load_project()
@@ -260,6 +265,7 @@ class ProjectStorageService:
         trash = self.trash_path() / relative_path
         trash.parent.mkdir(parents=True, exist_ok=True)
         shutil.move(str(source), str(trash))
+        self.discard_thumbnails(relative_path)
 
     def restore_from_trash(self, kind: str, digest: str, size: int) -> str | None:
         trash = self.trash_path() / kind
@@ -277,6 +283,34 @@ class ProjectStorageService:
                 return (Path(kind) / entry.name).as_posix()
         return None
 
+    def thumbnail_cache_dir(self) -> Path:
+        return self.project_dir / ".thumbnails"
+
+    def thumbnail_cache_path(self, asset_path: str, width: int, height: int) -> Path:
+        """Location of the cached ``width``x``height`` thumbnail for an asset (relative or absolute)."""
+        stem = self._thumbnail_stem(asset_path)
+        return stem.with_name(f"{stem.name}.{width}x{height}.png")
+
+    def discard_thumbnails(self, asset_path: str) -> None:
+        """Delete every cached thumbnail size of an asset; they are regenerated on demand."""
+        if not asset_path:
+            return
+        stem = self._thumbnail_stem(asset_path)
+        for cached in stem.parent.glob(f"{glob.escape(stem.name)}.*x*.png"):
+            try:
+                cached.unlink()
+            except OSError:
+                continue
+
+    def _thumbnail_stem(self, asset_path: str) -> Path:
+        absolute = self.resolve_asset_path(asset_path).resolve()
+        try:
+            relative = absolute.relative_to(self.project_dir.resolve())
+        except ValueError:
+            # Files outside the project still get a stable, collision-free cache name.
+            relative = Path("external") / hashlib.sha1(str(absolute).encode("utf-8")).hexdigest()
+        return self.thumbnail_cache_dir() / relative
+
     def trash_size(self) -> int:
         trash = self.trash_path()
         total = 0
@@ -287,10 +321,8 @@ class ProjectStorageService:
 
     @staticmethod
     def _hash_file(path: Path) -> tuple[str, int]:
-        hasher = hashlib.sha256()
-        size = 0
+        # SHA-256 stays the digest: existing project.json indexes store it for deduplication.
         with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(8192), b""):
-                size += len(chunk)
-                hasher.update(chunk)
-        return hasher.hexdigest(), size
+            digest = hashlib.file_digest(handle, "sha256").hexdigest()
+            size = os.fstat(handle.fileno()).st_size
+        return digest, size
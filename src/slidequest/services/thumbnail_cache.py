@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QImage, QImageReader
+
+
+def load_thumbnail(source: str, mtime: float, size: QSize, cache_path: Path | None = None) -> QImage:
+    """Decode ``source`` scaled to ``size``, reusing/refreshing the on-disk copy at ``cache_path``.
+
+    Safe to call from pool threads: only QImage is used. ``cache_path`` comes from
+    ``ProjectStorageService.thumbnail_cache_path`` so the project owns (and cleans up) the files.
+    """
+    if cache_path is not None:
+        try:
+            if cache_path.stat().st_mtime >= mtime:
+                cached = QImage(str(cache_path))
+                if not cached.isNull():
+                    return cached
+        except OSError:
+            pass
+    # Decoding straight to the target size never allocates the full-resolution pixel buffer
+    # (JPEG scales in the DCT domain).
+    reader = QImageReader(source)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(size, Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+    image = reader.read()
+    if image.isNull() or cache_path is None:
+        return image
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return image
+    # Best effort: save() just returns False when the cache folder is not writable.
+    image.save(str(cache_path), "PNG")
+    return image
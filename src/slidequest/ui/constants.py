@@ -12,6 +12,7 @@ EXPLORER_HEADER_HEIGHT = 60
 EXPLORER_FOOTER_HEIGHT = EXPLORER_HEADER_HEIGHT
 DETAIL_HEADER_HEIGHT = 60
 DETAIL_FOOTER_HEIGHT = DETAIL_HEADER_HEIGHT
+PIXMAP_CACHE_LIMIT_KB = 256 * 1024
 
 
 class ButtonSpec:
@@ -152,7 +153,7 @@ STATUS_BUTTON_SPECS: tuple[ButtonSpec, ...] = (
     ),
 )
 
-STATUS_VOLUME_BUTTONS: set[str] = set()
+STATUS_VOLUME_BUTTONS: frozenset[str] = frozenset()
 
 EXPLORER_CRUD_SPECS: tuple[ButtonSpec, ...] = (
     ButtonSpec("ExplorerCreateButton", ACTION_ICONS["create"], "Neuen Eintrag anlegen"),
@@ -232,8 +233,10 @@ PLAYLIST_CONTROL_SPECS: tuple[ButtonSpec, ...] = (
     ),
 )
 
-PLAYLIST_VOLUME_BUTTONS = {
-    "PlaylistMuteButton",
-    "PlaylistVolumeDownButton",
-    "PlaylistVolumeUpButton",
-}
+PLAYLIST_VOLUME_BUTTONS: frozenset[str] = frozenset(
+    {
+        "PlaylistMuteButton",
+        "PlaylistVolumeDownButton",
+        "PlaylistVolumeUpButton",
+    }
+)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import base64
 import mimetypes
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
@@ -12,6 +14,9 @@ from PySide6.QtGui import QIcon, QPixmap
 
 from slidequest.views.master.ai_models import ProjectServiceProtocol
 
+# Imports are disk bound; a few workers overlap reads without flooding the disk.
+MAX_IMPORT_WORKERS = 8
+
 
 @dataclass(slots=True)
 class ReferenceImportStats:
@@ -45,38 +50,39 @@ class ReferenceImageStore:
         paths = list(raw_paths)
         total = len(paths)
         stats = ReferenceImportStats(attempted=total, added=0)
-        processed = 0
-        for raw in paths:
-            source = raw[7:] if raw.startswith("file://") else raw
-            file_path = Path(source)
-            failed = False
-            reason = ""
-            if not file_path.exists():
-                failed = True
-                reason = "Datei nicht gefunden"
-            else:
-                try:
-                    stored = self._project_service.import_file("replicate", str(file_path))
-                except FileNotFoundError:
-                    failed = True
-                    reason = "Import fehlgeschlagen"
-                else:
-                    with self._lock:
-                        if stored in self._image_ids:
-                            stored = ""
-                        else:
-                            self._image_ids.append(stored)
-                    if stored:
-                        stats.added += 1
-                    else:
-                        failed = False  # duplicate handled silently
-            if failed:
-                stats.failed.append((raw, reason or "Unbekannter Fehler"))
-            processed += 1
-            if on_progress is not None and total:
-                on_progress(processed, total)
+        if not paths:
+            return stats
+        results: list[tuple[str, str]] = [("", "")] * total
+        workers = min(MAX_IMPORT_WORKERS, os.cpu_count() or 1, total)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._import_one, raw): index for index, raw in enumerate(paths)}
+            for processed, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                if on_progress is not None:
+                    on_progress(processed, total)
+        # Ids are recorded in input order regardless of which import finished first.
+        for raw, (stored, reason) in zip(paths, results):
+            if reason:
+                stats.failed.append((raw, reason))
+                continue
+            with self._lock:
+                if stored in self._image_ids:
+                    continue  # duplicate handled silently
+                self._image_ids.append(stored)
+            stats.added += 1
         return stats
 
+    def _import_one(self, raw: str) -> tuple[str, str]:
+        """Return (stored asset id, failure reason) for one dropped path."""
+        source = raw[7:] if raw.startswith("file://") else raw
+        file_path = Path(source)
+        if not file_path.exists():
+            return "", "Datei nicht gefunden"
+        try:
+            return self._project_service.import_file("replicate", str(file_path)), ""
+        except FileNotFoundError:
+            return "", "Import fehlgeschlagen"
+
     def remove(self, asset_id: str) -> bool:
         with self._lock:
             try:
@@ -648,10 +648,11 @@ class AISectionMixin:
 
         def resolver(path: str) -> str:
             return str(self._project_service.resolve_asset_path(path))
+        thumbnail_path = self._project_service.thumbnail_cache_path
         if self._ai_gallery is not None:
-            self._ai_gallery.set_entries(entries, resolver)
+            self._ai_gallery.set_entries(entries, resolver, thumbnail_path)
         if self._ai_drawer_gallery is not None:
-            self._ai_drawer_gallery.set_entries(entries, resolver)
+            self._ai_drawer_gallery.set_entries(entries, resolver, thumbnail_path)
 
     def _sync_ai_style_prompt(self) -> None:
         editor = self._ai_style_input
@@ -28,7 +28,7 @@ from slidequest.ui.constants import (
     SYMBOL_BUTTON_SPECS,
     ButtonSpec,
 )
-from slidequest.views.widgets.common import IconBinding, IconToolButton
+from slidequest.views.widgets.common import IconBinding, IconToolButton, cached_icon
 
 
 class ChromeSectionMixin:
@@ -153,6 +153,7 @@ class ChromeSectionMixin:
     # Theming
     # ------------------------------------------------------------------ #
     def _apply_surface_theme(self) -> None:
+        cached_icon.cache_clear()
         palette = self.palette()
         window_color = palette.color(QPalette.ColorRole.Window)
         is_dark = window_color.value() < 128
@@ -312,7 +313,7 @@ class ChromeSectionMixin:
 
     @staticmethod
     def _tinted_icon(path: Path, color: QColor, size: QSize) -> QIcon:
-        icon = QIcon(str(path))
+        icon = cached_icon(str(path))
         pixmap = icon.pixmap(size)
         if pixmap.isNull():
             return icon
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QSize
+import os
+from collections.abc import Mapping
+
+from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtGui import QColor, QFont, QPainter, QPalette, QPixmap, QIcon
 from PySide6.QtWidgets import (
     QApplication,
@@ -26,6 +29,9 @@ from slidequest.views.master.explorer_controller import ExplorerController
 from slidequest.views.widgets.layout_preview import LayoutPreviewCard
 from slidequest.views.widgets.slide_item_widget import SlideListItemWidget
 
+# Marks explorer rows whose real preview has been built; rows start with the shared placeholder.
+SLIDE_PREVIEW_LOADED_ROLE = Qt.ItemDataRole.UserRole + 1
+
 
 class ExplorerSectionMixin:
     """Encapsulates slide explorer population, layout handling, and preview helpers."""
@@ -68,18 +74,42 @@ class ExplorerSectionMixin:
             card.setSelected(active_layout == card.layout_id)
 
     def _handle_preview_drop(self, area_id: int, source: str) -> None:
-        slide = self._current_slide
-        if slide is None or area_id <= 0:
+        if area_id <= 0 or self._current_slide is None:
             return
-        source = source.strip()
-        if not source:
+        # Drops are applied to the slide they landed on, even if the selection changes before the flush.
+        if self._pending_preview_drops and self._pending_preview_drop_slide is not self._current_slide:
+            self._flush_preview_drop()
+        pending = self._pending_preview_drops
+        if not pending:
+            QTimer.singleShot(0, self._flush_preview_drop)
+        self._pending_preview_drop_slide = self._current_slide
+        pending[area_id] = source
+
+    def _flush_preview_drop(self) -> None:
+        pending = dict(self._pending_preview_drops)
+        self._pending_preview_drops.clear()
+        slide = self._pending_preview_drop_slide
+        self._pending_preview_drop_slide = None
+        if slide is None or slide not in self._slides:
             return
-        normalized = normalize_media_path(source)
-        if not normalized:
+        sources: dict[int, str] = {}
+        for area_id, source in pending.items():
+            source = source.strip()
+            normalized = normalize_media_path(source) if source else ""
+            if normalized:
+                sources[area_id] = normalized
+        if not sources:
+            return
+        displayed = self._current_slide
+        self._viewmodel.select_slide(self._slides.index(slide))
+        images: dict[int, str] = {}
+        for area_id, normalized in sources.items():
+            images = self._viewmodel.update_area(area_id, normalized)
+        if displayed is not slide and displayed in self._slides:
+            self._viewmodel.select_slide(self._slides.index(displayed))
+            self._current_slide = displayed
+            self._refresh_slide_widget(slide)
             return
-        if slide in self._slides:
-            self._viewmodel.select_slide(self._slides.index(slide))
-        images = self._viewmodel.update_area(area_id, normalized)
         self._current_slide = self._viewmodel.current_slide
         self._set_current_layout(slide.layout.active_layout, images)
         self._refresh_slide_widget(slide)
@@ -170,6 +200,8 @@ class ExplorerSectionMixin:
         self._populate_slide_list(preserve_selection=True)
 
     def _on_slide_selected(self, item: QListWidgetItem | None) -> None:
+        if not self._slide_list_populated:
+            return
         if self._slide_list is not None:
             drag_row = getattr(self._slide_list, "_drag_active_row", None)
             if drag_row is not None:
@@ -189,7 +221,7 @@ class ExplorerSectionMixin:
 
         if slide:
             layout_id = slide.layout.active_layout
-            images = slide.images.copy()
+            images = slide.images
         else:
             layout_id = ""
             images = {}
@@ -253,6 +285,7 @@ class ExplorerSectionMixin:
                 widget = self._slide_list.itemWidget(list_item)
                 if widget is not None:
                     self._update_slide_item_widget(widget, slide)
+                    list_item.setData(SLIDE_PREVIEW_LOADED_ROLE, True)
                     list_item.setSizeHint(widget.sizeHint())
                 break
 
@@ -260,10 +293,11 @@ class ExplorerSectionMixin:
         if isinstance(widget, SlideListItemWidget):
             widget.set_slide(slide, self._build_preview_pixmap(slide))
 
-    def _set_current_layout(self, layout_id: str, images: dict[int, str] | None = None) -> None:
+    def _set_current_layout(self, layout_id: str, images: Mapping[int, str] | None = None) -> None:
         layout_id = layout_id or "1S|100/1R|100"
         self._current_layout_id = layout_id
-        image_map = images.copy() if images else {}
+        # Consumers treat the map as read-only (PresentationWindow copies internally).
+        image_map: Mapping[int, str] = images or {}
         resolved_for_preview = self._resolve_image_paths(image_map)
         if self._presentation_window:
             self._presentation_window.set_layout_description(layout_id)
@@ -278,14 +312,14 @@ class ExplorerSectionMixin:
     def _sync_preview_with_current_slide(self) -> None:
         slide = self._current_slide
         if slide:
-            self._set_current_layout(slide.layout.active_layout, slide.images.copy())
+            self._set_current_layout(slide.layout.active_layout, slide.images)
         else:
             self._set_current_layout(self._current_layout_id)
         refresher = getattr(self, "_refresh_token_overlays", None)
         if callable(refresher):
             refresher()
 
-    def _resolve_image_paths(self, images: dict[int, str]) -> dict[int, str]:
+    def _resolve_image_paths(self, images: Mapping[int, str]) -> dict[int, str]:
         resolved: dict[int, str] = {}
         project_service = getattr(self, "_project_service", None)
         for area_id, path in images.items():
@@ -314,6 +348,10 @@ class ExplorerSectionMixin:
             widget = self._detail_preview_canvas
         if widget is None or widget.size().isEmpty():
             return False
+        if window is not None:
+            window.finish_pending_loads()
+        if self._detail_preview_canvas is not None:
+            self._detail_preview_canvas.finish_pending_loads()
         app = QApplication.instance()
         if app is not None:
             app.processEvents()
@@ -330,6 +368,7 @@ class ExplorerSectionMixin:
         )
         if not scaled.save(str(target_path), "PNG"):
             return False
+        self._path_exists_cache.clear()
         try:
             relative = target_path.relative_to(PROJECT_ROOT)
         except ValueError:
@@ -338,6 +377,7 @@ class ExplorerSectionMixin:
         return True
 
     def _ensure_data_dirs(self) -> None:
+        self._path_exists_cache.clear()
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -354,6 +394,7 @@ class ExplorerSectionMixin:
             list_item = QListWidgetItem()
             list_item.setSizeHint(widget.sizeHint())
             list_item.setData(Qt.ItemDataRole.UserRole, slide)
+            list_item.setData(SLIDE_PREVIEW_LOADED_ROLE, False)
             self._slide_list.addItem(list_item)
             self._slide_list.setItemWidget(list_item, widget)
         selection_target = None
@@ -362,6 +403,7 @@ class ExplorerSectionMixin:
         elif slide_source:
             selection_target = slide_source[0]
         self._slide_list.blockSignals(previous_block)
+        self._slide_list_populated = True
         if selection_target is not None and self._slide_list.count():
             for row in range(self._slide_list.count()):
                 item = self._slide_list.item(row)
@@ -372,21 +414,35 @@ class ExplorerSectionMixin:
             self._slide_list.setCurrentRow(-1)
         self._refresh_slide_item_styles()
         self._update_slide_item_states()
+        self._slide_list.request_visible_rows()
 
     def _create_slide_list_widget(self, slide: SlideData) -> QWidget:
-        pixmap = self._build_preview_pixmap(slide)
-        widget = SlideListItemWidget(slide, pixmap, self)
+        widget = SlideListItemWidget(slide, None, self)
         widget.moveRequested.connect(self._move_slide)
         widget.setStyleSheet(self._build_slide_item_stylesheet())
         return widget
 
+    def _load_visible_slide_previews(self, first: int, last: int) -> None:
+        if not self._slide_list:
+            return
+        for row in range(max(0, first), min(last, self._slide_list.count() - 1) + 1):
+            list_item = self._slide_list.item(row)
+            if list_item.data(SLIDE_PREVIEW_LOADED_ROLE):
+                continue
+            widget = self._slide_list.itemWidget(list_item)
+            slide = list_item.data(Qt.ItemDataRole.UserRole)
+            if widget is None or slide is None:
+                continue
+            self._update_slide_item_widget(widget, slide)
+            list_item.setData(SLIDE_PREVIEW_LOADED_ROLE, True)
+
     def _build_preview_pixmap(self, slide: SlideData) -> QPixmap:
         preview_path = None
         if slide.layout.thumbnail_url:
-            candidate = PROJECT_ROOT / slide.layout.thumbnail_url
-            preview_path = candidate if candidate.exists() else None
-        if preview_path and preview_path.exists():
-            pix = QPixmap(str(preview_path)).scaled(
+            candidate = str(PROJECT_ROOT / slide.layout.thumbnail_url)
+            preview_path = candidate if self._path_exists(candidate) else None
+        if preview_path:
+            pix = QPixmap(preview_path).scaled(
                 96, 72, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
             )
             return pix
@@ -400,6 +456,14 @@ class ExplorerSectionMixin:
         painter.end()
         return pix
 
+    def _path_exists(self, path: str) -> bool:
+        cache: dict[str, bool] = self._path_exists_cache
+        exists = cache.get(path)
+        if exists is None:
+            exists = os.path.exists(path)
+            cache[path] = exists
+        return exists
+
     def _slide_matches_query(self, slide: SlideData, query: str) -> bool:
         query = query.lower()
         candidates = [slide.title or "", slide.subtitle or "", slide.group or ""]
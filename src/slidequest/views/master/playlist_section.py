@@ -1036,7 +1036,7 @@ class _SoundboardBar(QFrame):
 
     @staticmethod
     def _has_audio_files(mime) -> bool:
-        return any(
+        return mime.hasUrls() and any(
             url.isLocalFile() and Path(url.toLocalFile()).suffix.lower() in _AUDIO_EXTENSIONS
             for url in mime.urls()
         )
@@ -1096,7 +1096,7 @@ class _SoundboardButton(QToolButton):
 
     @staticmethod
     def _has_image(mime) -> bool:
-        return any(
+        return mime.hasUrls() and any(
             url.isLocalFile() and Path(url.toLocalFile()).suffix.lower() in _IMAGE_EXTENSIONS
             for url in mime.urls()
         )
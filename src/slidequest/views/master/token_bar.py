@@ -92,7 +92,9 @@ class TokenBar(QFrame):
 
     @staticmethod
     def _has_image(mime) -> bool:
-        return any(url.isLocalFile() and Path(url.toLocalFile()).suffix.lower() in _IMAGE_EXTENSIONS for url in mime.urls())
+        return mime.hasUrls() and any(
+            url.isLocalFile() and Path(url.toLocalFile()).suffix.lower() in _IMAGE_EXTENSIONS for url in mime.urls()
+        )
 
     @staticmethod
     def _extract_files(mime) -> list[str]:
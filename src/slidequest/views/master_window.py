@@ -8,7 +8,7 @@ import threading
 from pathlib import Path
 
 from PySide6.QtCore import Qt, QEvent, QTimer, QObject, QUrl
-from PySide6.QtGui import QAction, QIcon, QPalette, QDesktopServices, QImage, QPainter, QPixmap
+from PySide6.QtGui import QAction, QPalette, QDesktopServices, QImage, QPainter, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -56,10 +56,35 @@ from slidequest.views.master.ai_section import AISectionMixin
 from slidequest.views.master.light_section import LightControlSectionMixin
 from slidequest.views.master.token_bar import TokenBar
 from slidequest.views.presentation_window import PresentationWindow
-from slidequest.views.widgets.common import IconBinding
+from slidequest.views.widgets.common import IconBinding, cached_icon
 from slidequest.views.widgets.layout_preview import CanvasTokenInstance, LayoutPreviewCanvas, LayoutPreviewCard
 from slidequest.views.widgets.slide_list import SlideListWidget
 
+WINDOW_STYLESHEET = """
+QListWidget#SlideListView {
+    background-color: transparent;
+    border: none;
+}
+QListWidget#SlideListView::item {
+    background-color: transparent;
+    border: none;
+}
+QListView#ReplicateGalleryWidget {
+    background: transparent;
+    border: none;
+}
+QListView#ReplicateGalleryWidget::item {
+    color: rgba(255, 255, 255, 0.85);
+    border: none;
+    margin: 0px;
+    padding: 0px;
+}
+QListView#ReplicateGalleryWidget::item:selected {
+    border: 1px solid rgba(120, 190, 255, 0.9);
+    border-radius: 10px;
+}
+"""
+
 
 class MasterWindow(
     LightControlSectionMixin,
@@ -74,6 +99,7 @@ class MasterWindow(
 
     def __init__(self) -> None:
         super().__init__()
+        pal = self.palette()
         self.setWindowTitle("SlideQuest – Master")
         self.setMinimumSize(960, 600)
         self._project_status_bar: QFrame | None = None
@@ -88,11 +114,17 @@ class MasterWindow(
         self._symbol_button_map: dict[str, QToolButton] = {}
         self._status_buttons: list[QToolButton] = []
         self._status_button_map: dict[str, QToolButton] = {}
+        self._layout_launcher_button: QToolButton | None = None
+        self._audio_launcher_button: QToolButton | None = None
+        self._note_launcher_button: QToolButton | None = None
+        self._ai_launcher_button: QToolButton | None = None
+        self._light_launcher_button: QToolButton | None = None
         self._header_views: list[QFrame] = []
         self._detail_container: QWidget | None = None
         self._detail_stack: QStackedWidget | None = None
         self._detail_view_widgets: dict[str, QWidget] = {}
         self._detail_mode_buttons: dict[str, QToolButton | None] = {}
+        self._button_to_mode: dict[QToolButton, str] = {}
         self._detail_active_mode: str | None = None
         self._line_edit_actions: list[tuple[QAction, Path]] = []
         self._search_input: QLineEdit | None = None
@@ -103,7 +135,7 @@ class MasterWindow(
         self._volume_button_map: dict[str, QToolButton] = {}
         self._last_volume_value = 75
         self._icon_bindings: list[IconBinding] = []
-        self._playlist_accent_color = self.palette().color(QPalette.ColorRole.Highlight)
+        self._playlist_accent_color = pal.color(QPalette.ColorRole.Highlight)
         self._audio_service = AudioService()
         self._project_service = ProjectStorageService()
         self._storage = SlideStorage(self._project_service)
@@ -125,6 +157,7 @@ class MasterWindow(
         self._active_transcript_note: str | None = None
         self._slides: list[SlideData] = self._viewmodel.slides
         self._slide_list: SlideListWidget | None = None
+        self._slide_list_populated = False
         self._current_slide: SlideData | None = self._viewmodel.current_slide
         self._detail_preview_canvas: LayoutPreviewCanvas | None = None
         self._related_layout_layout: QHBoxLayout | None = None
@@ -132,6 +165,9 @@ class MasterWindow(
         self._current_layout_id: str = ""
         self._token_bar: TokenBar | None = None
         self._token_pixmap_cache: dict[tuple[str, str, str, int], QPixmap] = {}
+        self._path_exists_cache: dict[str, bool] = {}
+        self._pending_preview_drops: dict[int, str] = {}
+        self._pending_preview_drop_slide: SlideData | None = None
         self._token_palette_map: dict[str, dict[str, str]] = {}
         self._token_overlay_dirty = True
         self._token_signature: tuple[tuple[str, str, float, float, float, float], ...] = tuple()
@@ -139,11 +175,16 @@ class MasterWindow(
         self._filtered_slides: list[SlideData] | None = None
         self._search_filter_active = False
         self._search_filter_text = ""
-        self._icon_base_color = self.palette().color(QPalette.ColorRole.Text)
-        self._icon_accent_color = self.palette().color(QPalette.ColorRole.Highlight)
-        self._container_color = self.palette().color(QPalette.ColorRole.Window)
+        self._icon_base_color = pal.color(QPalette.ColorRole.Text)
+        self._icon_accent_color = pal.color(QPalette.ColorRole.Highlight)
+        self._container_color = pal.color(QPalette.ColorRole.Window)
         self._content_splitter: QSplitter | None = None
         self._detail_last_sizes: list[int] = []
+        self._last_splitter_geom: tuple[int, int, int] = (0, 0, 0)
+        self._splitter_resize_timer = QTimer(self)
+        self._splitter_resize_timer.setSingleShot(True)
+        self._splitter_resize_timer.setInterval(16)
+        self._splitter_resize_timer.timeout.connect(self._apply_splitter_sizes)
         self._setup_placeholder()
         self._bootstrap_light_sync()
         self._update_project_title_label()
@@ -152,16 +193,27 @@ class MasterWindow(
 
     def _apply_surface_theme(self) -> None:  # type: ignore[override]
         super()._apply_surface_theme()
+        if self.styleSheet() != WINDOW_STYLESHEET:
+            self.setStyleSheet(WINDOW_STYLESHEET)
         self._refresh_slide_item_styles()
 
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:
         if obj is self._content_splitter and event.type() in {QEvent.Type.Resize, QEvent.Type.Show}:
-            QTimer.singleShot(0, self._apply_splitter_sizes)
+            self._splitter_resize_timer.start()
         return super().eventFilter(obj, event)
 
     def _setup_placeholder(self) -> None:
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_placeholder()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_placeholder(self) -> None:
+        # Layouts are built detached and attached once populated so Qt does not
+        # re-run geometry for every child added along the way.
         central = QWidget(self)
-        layout = QVBoxLayout(central)
+        layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
@@ -174,11 +226,17 @@ class MasterWindow(
 
         viewport = QFrame(central)
         viewport.setObjectName("AppViewport")
-        viewport_layout = QHBoxLayout(viewport)
+        viewport_layout = QHBoxLayout()
         viewport_layout.setContentsMargins(0, 0, 0, 0)
         viewport_layout.setSpacing(0)
 
         symbol_view = self._build_symbol_view(viewport)
+        # Launchers are wired and toggled often; keep direct references instead of map lookups.
+        self._layout_launcher_button = self._symbol_button_map.get("LayoutExplorerLauncher")
+        self._audio_launcher_button = self._symbol_button_map.get("AudioExplorerLauncher")
+        self._note_launcher_button = self._symbol_button_map.get("NoteExplorerLauncher")
+        self._ai_launcher_button = self._symbol_button_map.get("AIExplorerLauncher")
+        self._light_launcher_button = self._symbol_button_map.get("LightControlLauncher")
 
         splitter = QSplitter(Qt.Orientation.Horizontal, viewport)
         splitter.setObjectName("ContentSplitter")
@@ -189,7 +247,7 @@ class MasterWindow(
         explorer_container = QWidget(splitter)
         explorer_container.setObjectName("ExplorerView")
         self._explorer_container = explorer_container
-        explorer_layout = QVBoxLayout(explorer_container)
+        explorer_layout = QVBoxLayout()
         explorer_layout.setContentsMargins(0, 0, 0, 0)
         explorer_layout.setSpacing(0)
 
@@ -197,7 +255,7 @@ class MasterWindow(
         explorer_header.setObjectName("ExplorerHeader")
         explorer_header.setFixedHeight(EXPLORER_HEADER_HEIGHT)
         self._header_views.append(explorer_header)
-        explorer_header_layout = QHBoxLayout(explorer_header)
+        explorer_header_layout = QHBoxLayout()
         explorer_header_layout.setContentsMargins(8, 4, 8, 4)
         explorer_header_layout.setSpacing(8)
 
@@ -207,7 +265,7 @@ class MasterWindow(
         search_input.setToolTip("ExplorerSearchField")
         search_input.setFixedHeight(SYMBOL_BUTTON_SIZE)
         search_action = search_input.addAction(
-            QIcon(str(ACTION_ICONS["search"])),
+            cached_icon(str(ACTION_ICONS["search"])),
             QLineEdit.ActionPosition.LeadingPosition,
         )
         self._line_edit_actions.append((search_action, ACTION_ICONS["search"]))
@@ -228,6 +286,7 @@ class MasterWindow(
 
         explorer_header_layout.addWidget(search_input, 1)
         explorer_header_layout.addWidget(filter_button)
+        explorer_header.setLayout(explorer_header_layout)
 
         explorer_footer = QFrame(explorer_container)
         explorer_footer.setObjectName("ExplorerFooter")
@@ -236,45 +295,35 @@ class MasterWindow(
         explorer_main_scroll = QScrollArea(explorer_container)
         explorer_main_scroll.setObjectName("ExplorerMainScroll")
         explorer_main_scroll.setWidgetResizable(True)
-        explorer_main_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        explorer_main_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         explorer_main_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        explorer_main_scroll.setStyleSheet("QScrollBar { width: 0px; }")
         explorer_main_scroll.setFrameShape(QFrame.Shape.NoFrame)
 
         explorer_main = QWidget()
         explorer_main.setObjectName("ExplorerMainView")
-        explorer_main_layout = QVBoxLayout(explorer_main)
+        explorer_main_layout = QVBoxLayout()
         explorer_main_layout.setContentsMargins(4, 4, 4, 4)
         explorer_main_layout.setSpacing(4)
         self._slide_list = SlideListWidget(explorer_main)
         self._slide_list.setObjectName("SlideListView")
         self._slide_list.setFrameShape(QFrame.Shape.NoFrame)
         self._slide_list.viewport().setAutoFillBackground(False)
-        self._slide_list.setStyleSheet(
-            """
-            QListWidget#SlideListView {
-                background-color: transparent;
-                border: none;
-            }
-            QListWidget#SlideListView::item {
-                background-color: transparent;
-                border: none;
-            }
-            """
-        )
         self._slide_list.setSpacing(6)
+        self._slide_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         explorer_main_layout.addWidget(self._slide_list)
+        explorer_main.setLayout(explorer_main_layout)
         explorer_main_scroll.setWidget(explorer_main)
         self._slide_list.currentItemChanged.connect(
             lambda current, _prev: self._on_slide_selected(current)
         )
         self._slide_list.orderChanged.connect(self._handle_slide_order_changed)
-        self._populate_slide_list()
+        self._slide_list.visibleRowsChanged.connect(self._load_visible_slide_previews)
+        QTimer.singleShot(0, self._populate_slide_list)
 
         explorer_layout.addWidget(explorer_header)
         explorer_layout.addWidget(explorer_main_scroll, 1)
         explorer_layout.addWidget(explorer_footer)
-        explorer_footer_layout = QHBoxLayout(explorer_footer)
+        explorer_footer_layout = QHBoxLayout()
         explorer_footer_layout.setContentsMargins(8, 4, 8, 4)
         explorer_footer_layout.setSpacing(8)
         explorer_footer_layout.addStretch(1)
@@ -291,22 +340,25 @@ class MasterWindow(
             edit_button.clicked.connect(self._handle_edit_slide)
         if delete_button := self._crud_button_map.get("ExplorerDeleteButton"):
             delete_button.clicked.connect(self._handle_delete_slide)
+        explorer_footer.setLayout(explorer_footer_layout)
+        explorer_container.setLayout(explorer_layout)
 
         detail_container = QWidget(splitter)
         detail_container.setObjectName("DetailView")
         self._detail_container = detail_container
-        detail_layout = QVBoxLayout(detail_container)
+        detail_layout = QVBoxLayout()
         detail_layout.setContentsMargins(0, 0, 0, 0)
         detail_layout.setSpacing(0)
 
         detail_stack = QStackedWidget(detail_container)
         detail_stack.setObjectName("DetailStack")
         detail_layout.addWidget(detail_stack, 1)
+        detail_container.setLayout(detail_layout)
         self._detail_stack = detail_stack
 
         layout_detail = QWidget(detail_stack)
         layout_detail.setObjectName("LayoutDetailView")
-        layout_detail_layout = QVBoxLayout(layout_detail)
+        layout_detail_layout = QVBoxLayout()
         layout_detail_layout.setContentsMargins(0, 0, 0, 0)
         layout_detail_layout.setSpacing(0)
 
@@ -315,12 +367,13 @@ class MasterWindow(
         detail_header.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         detail_header.setFixedHeight(DETAIL_HEADER_HEIGHT)
         self._header_views.append(detail_header)
-        detail_header_layout = QHBoxLayout(detail_header)
+        detail_header_layout = QHBoxLayout()
         detail_header_layout.setContentsMargins(12, 6, 12, 6)
         detail_header_layout.setSpacing(8)
         self._build_token_bar(detail_header, detail_header_layout)
 
         detail_header_layout.addStretch(1)
+        detail_header.setLayout(detail_header_layout)
 
         detail_footer = QFrame(layout_detail)
         detail_footer.setObjectName("DetailFooter")
@@ -332,19 +385,18 @@ class MasterWindow(
         detail_main_scroll = QScrollArea(layout_detail)
         detail_main_scroll.setObjectName("DetailMainScroll")
         detail_main_scroll.setWidgetResizable(True)
-        detail_main_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        detail_main_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         detail_main_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        detail_main_scroll.setStyleSheet("QScrollBar { width: 0px; }")
         detail_main_scroll.setFrameShape(QFrame.Shape.NoFrame)
 
         detail_main = QWidget()
         detail_main.setObjectName("DetailMainView")
-        detail_main_layout = QVBoxLayout(detail_main)
+        detail_main_layout = QVBoxLayout()
         detail_main_layout.setContentsMargins(12, 12, 12, 12)
         detail_main_layout.setSpacing(12)
 
         initial_layout = self._slides[0].layout.active_layout if self._slides else "1S|100/1R|100"
-        initial_images = self._slides[0].images.copy() if self._slides else {}
+        initial_images = self._slides[0].images if self._slides else {}
         self._current_layout_id = initial_layout
         self._detail_preview_canvas = LayoutPreviewCanvas(initial_layout, detail_main, accepts_drop=True, supports_tokens=True)
         self._detail_preview_canvas.setObjectName("DetailPreviewCanvas")
@@ -355,45 +407,50 @@ class MasterWindow(
         self._detail_preview_canvas.tokenDeleteRequested.connect(self._handle_token_delete_requested)
         preview_wrapper = QFrame(detail_main)
         preview_wrapper.setObjectName("DetailPreviewWrapper")
-        preview_layout = QHBoxLayout(preview_wrapper)
+        preview_layout = QHBoxLayout()
         preview_layout.setContentsMargins(0, 0, 0, 0)
         preview_layout.setSpacing(6)
         preview_layout.addWidget(self._detail_preview_canvas, 1)
         ai_drawer = self._build_ai_drawer(preview_wrapper)
+        self._ai_drawer_gallery.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         preview_layout.addWidget(ai_drawer, 0)
+        preview_wrapper.setLayout(preview_layout)
         detail_main_layout.addWidget(preview_wrapper, 1)
+        detail_main.setLayout(detail_main_layout)
         if initial_images:
             self._detail_preview_canvas.set_area_images(self._resolve_image_paths(initial_images))
         self._sync_preview_with_current_slide()
         self._refresh_token_overlays(force=True)
 
-        detail_footer_layout = QVBoxLayout(detail_footer)
+        detail_footer_layout = QVBoxLayout()
         detail_footer_layout.setContentsMargins(12, 8, 12, 12)
         detail_footer_layout.setSpacing(8)
         related_scroll = QScrollArea(detail_footer)
         related_scroll.setObjectName("LayoutSelectorScroll")
         related_scroll.setWidgetResizable(True)
-        related_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        related_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         related_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        related_scroll.setStyleSheet("QScrollBar:horizontal { height: 0px; }")
         related_scroll.setFrameShape(QFrame.Shape.NoFrame)
 
         related_items_container = QWidget()
         related_items_container.setObjectName("LayoutSelectorContainer")
-        horizontal_layout = QHBoxLayout(related_items_container)
+        horizontal_layout = QHBoxLayout()
         horizontal_layout.setContentsMargins(0, 0, 0, 0)
         horizontal_layout.setSpacing(8)
+        related_items_container.setLayout(horizontal_layout)
         related_scroll.setWidget(related_items_container)
         detail_footer_layout.addWidget(related_scroll)
+        detail_footer.setLayout(detail_footer_layout)
 
         self._related_layout_layout = horizontal_layout
-        self._populate_related_layouts()
+        QTimer.singleShot(0, self._populate_related_layouts)
 
         detail_main_scroll.setWidget(detail_main)
 
         layout_detail_layout.addWidget(detail_header)
         layout_detail_layout.addWidget(detail_main_scroll, 1)
         layout_detail_layout.addWidget(detail_footer)
+        layout_detail.setLayout(layout_detail_layout)
         detail_stack.addWidget(layout_detail)
         self._detail_view_widgets["layout"] = layout_detail
 
@@ -412,15 +469,21 @@ class MasterWindow(
         detail_stack.addWidget(light_detail)
         self._detail_view_widgets["lights"] = light_detail
 
+        splitter.blockSignals(True)
+        splitter.setUpdatesEnabled(False)
         splitter.addWidget(explorer_container)
         splitter.addWidget(detail_container)
         splitter.setStretchFactor(0, 0)
         splitter.setStretchFactor(1, 1)
         splitter.installEventFilter(self)
         self._apply_splitter_sizes()
+        splitter.setUpdatesEnabled(True)
+        splitter.blockSignals(False)
+        splitter.update()
 
         viewport_layout.addWidget(symbol_view)
         viewport_layout.addWidget(splitter, 1)
+        viewport.setLayout(viewport_layout)
 
         layout.addWidget(status_bar)
         layout.addWidget(viewport, 1)
@@ -702,27 +765,26 @@ class MasterWindow(
         self._refresh_token_overlays()
 
     def _wire_symbol_launchers(self) -> None:
-        layout_button = self._symbol_button_map.get("LayoutExplorerLauncher")
-        audio_button = self._symbol_button_map.get("AudioExplorerLauncher")
-        note_button = self._symbol_button_map.get("NoteExplorerLauncher")
-        ai_button = self._symbol_button_map.get("AIExplorerLauncher")
-        light_button = self._symbol_button_map.get("LightControlLauncher")
         self._detail_mode_buttons = {
-            "layout": layout_button,
-            "audio": audio_button,
-            "notes": note_button,
-            "ai": ai_button,
-            "lights": light_button,
+            "layout": self._layout_launcher_button,
+            "audio": self._audio_launcher_button,
+            "notes": self._note_launcher_button,
+            "ai": self._ai_launcher_button,
+            "lights": self._light_launcher_button,
         }
-        handlers_connected = False
-        for mode, button in self._detail_mode_buttons.items():
-            if button is None:
-                continue
-            handlers_connected = True
-            button.toggled.connect(lambda checked, mode=mode: self._handle_detail_launcher_toggled(mode, checked))
-        if handlers_connected:
+        self._button_to_mode = {
+            button: mode for mode, button in self._detail_mode_buttons.items() if button is not None
+        }
+        for button in self._button_to_mode:
+            button.toggled.connect(self._on_detail_mode_toggled)
+        if self._button_to_mode:
             self._initialize_detail_view_state()
 
+    def _on_detail_mode_toggled(self, checked: bool) -> None:
+        mode = self._button_to_mode.get(self.sender())
+        if mode is not None:
+            self._handle_detail_launcher_toggled(mode, checked)
+
     def _initialize_detail_view_state(self) -> None:
         active_mode = self._resolve_checked_detail_mode()
         if active_mode:
@@ -1126,7 +1188,7 @@ class MasterWindow(
         self._active_transcript_note = None
 
     def _set_record_button_checked(self, checked: bool) -> None:
-        button = self._record_button or self._status_button_map.get("ProjectRecordButton")
+        button = self._record_button
         if button is None or button.isChecked() == checked:
             return
         button.blockSignals(True)
@@ -1209,6 +1271,7 @@ class MasterWindow(
         splitter = self._content_splitter
         if detail is None:
             return
+        self._last_splitter_geom = (0, 0, 0)
         if visible:
             detail.show()
             if splitter:
@@ -1221,9 +1284,7 @@ class MasterWindow(
                 sizes = splitter.sizes()
                 if sizes:
                     self._detail_last_sizes = sizes
-                    if len(sizes) >= 2:
-                        explorer_total = sizes[0] + sizes[1]
-                        splitter.setSizes([explorer_total, 0])
+            # Hidden splitter children hand their space to the explorer.
             detail.hide()
 
     def _apply_splitter_sizes(self) -> None:
@@ -1236,11 +1297,17 @@ class MasterWindow(
             return
         desired = max(300, min(explorer.sizeHint().width(), int(total * 0.2)))
         detail_width = max(total - desired, desired)
-        splitter.blockSignals(True)
+        geometry = (total, desired, detail_width)
+        if geometry == self._last_splitter_geom:
+            return
+        # Restore the previous state so callers that already block the splitter stay blocked.
+        previous = splitter.blockSignals(True)
         splitter.setSizes([desired, detail_width])
-        splitter.blockSignals(False)
+        splitter.blockSignals(previous)
+        self._last_splitter_geom = geometry
 
     def _enforce_splitter_ratio(self, _pos: int, _index: int) -> None:
+        self._last_splitter_geom = (0, 0, 0)
         self._apply_splitter_sizes()
 
     def _wire_volume_buttons(self, buttons: dict[str, QToolButton]) -> None:
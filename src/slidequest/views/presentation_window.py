@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QMainWindow, QSizePolicy, QVBoxLayout, QWidget
 
+from slidequest.services.project_service import ProjectStorageService
 from slidequest.utils.media import resolve_media_path
 from slidequest.views.widgets.layout_preview import CanvasTokenInstance, LayoutPreviewCanvas
 
 
+@lru_cache(maxsize=256)
+def _resolve_cached(path: str, project_dir: Path | None) -> str:
+    # project_dir is part of the key so switching projects never reuses stale paths.
+    return resolve_media_path(path)
+
+
 class PresentationWindow(QMainWindow):
     """Secondary window that mirrors the current slide layout."""
 
@@ -22,46 +34,79 @@ class PresentationWindow(QMainWindow):
         self._current_layout = "1S|100/1R|100"
         self._source_images: dict[int, str] = {}
         self._resolved_images: dict[int, str] = {}
+        self._resolved_project_dir: Path | None = None
+        self._tokens: list[CanvasTokenInstance] = []
+        self._canvas: LayoutPreviewCanvas | None = None
 
-        self._canvas = LayoutPreviewCanvas(self._current_layout, self, supports_tokens=True)
-        self._canvas.setObjectName("PresentationCanvas")
-        self._canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self._canvas.tokenDropped.connect(self.tokenDropped)
-        self._canvas.tokenTransformChanged.connect(self.tokenTransformChanged)
-        self._canvas.tokenDeleteRequested.connect(self.tokenDeleteRequested)
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        if self._canvas is None:
+            self._build_canvas()
+        super().showEvent(event)
+
+    def _build_canvas(self) -> None:
+        canvas = LayoutPreviewCanvas(self._current_layout, self, supports_tokens=True)
+        canvas.setObjectName("PresentationCanvas")
+        canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        canvas.tokenDropped.connect(self.tokenDropped)
+        canvas.tokenTransformChanged.connect(self.tokenTransformChanged)
+        canvas.tokenDeleteRequested.connect(self.tokenDeleteRequested)
 
         container = QWidget(self)
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
-        layout.addWidget(self._canvas)
+        layout.addWidget(canvas)
         self.setCentralWidget(container)
+        self._canvas = canvas
+        canvas.set_area_images(self._resolved_images)
+        canvas.set_tokens(self._tokens)
 
     def set_layout_description(self, layout_description: str) -> None:
         layout_description = layout_description or "1S|100/1R|100"
         self._current_layout = layout_description
-        self._canvas.set_layout_description(layout_description)
+        if self._canvas is not None:
+            self._canvas.set_layout_description(layout_description)
+
+    def set_area_images(self, images: Mapping[int, str] | None) -> None:
+        images = images or {}
+        project_dir = ProjectStorageService.active_project_dir()
+        if images == self._source_images and project_dir == self._resolved_project_dir:
+            return
+        self._source_images = dict(images)
+        self._resolved_project_dir = project_dir
+        resolved = {
+            area_id: _resolve_cached(path, project_dir)
+            for area_id, path in self._source_images.items()
+            if path
+        }
+        if resolved == self._resolved_images:
+            return
+        self._resolved_images = resolved
+        if self._canvas is not None:
+            self._canvas.set_area_images(resolved)
 
-    def set_area_images(self, images: dict[int, str] | None) -> None:
-        self._source_images = images.copy() if images else {}
-        self._resolved_images = {}
-        for area_id, path in self._source_images.items():
-            if path:
-                self._resolved_images[area_id] = resolve_media_path(path)
-        self._canvas.set_area_images(self._resolved_images)
+    def finish_pending_loads(self) -> None:
+        if self._canvas is not None:
+            self._canvas.finish_pending_loads()
 
     def set_tokens(self, tokens: list[CanvasTokenInstance] | None) -> None:
-        self._canvas.set_tokens(tokens or [])
+        self._tokens = list(tokens or [])
+        if self._canvas is not None:
+            self._canvas.set_tokens(self._tokens)
 
     @property
     def current_layout(self) -> str:
         return self._current_layout
 
-    def current_state(self) -> tuple[str, dict[int, str]]:
-        return self._current_layout, self._source_images.copy()
+    def current_state(self) -> tuple[str, MappingProxyType[int, str]]:
+        return self._current_layout, MappingProxyType(self._source_images)
+
+    def resolved_images(self) -> MappingProxyType[int, str]:
+        return MappingProxyType(self._resolved_images)
 
-    def resolved_images(self) -> dict[int, str]:
-        return self._resolved_images.copy()
+    def snapshot(self) -> tuple[str, dict[int, str]]:
+        """Return a mutable copy of the current layout and source images."""
+        return self._current_layout, dict(self._source_images)
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
         super().closeEvent(event)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import QRect, QRectF, QSize, Qt, Signal
+from PySide6.QtCore import QMetaMethod, QRect, QSize, Qt, Signal
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QLayout,
     QLayoutItem,
@@ -14,6 +17,12 @@ from PySide6.QtWidgets import (
 )
 
 
+@lru_cache(maxsize=128)
+def cached_icon(path: str) -> QIcon:
+    """Return a shared QIcon per file so repeated button builds skip the decode."""
+    return QIcon(path)
+
+
 @dataclass
 class IconBinding:
     button: QToolButton
@@ -33,28 +42,53 @@ class IconToolButton(QToolButton):
     def is_hovered(self) -> bool:
         return self._hovered
 
+    def _has_hover_listeners(self) -> bool:
+        return self.isSignalConnected(QMetaMethod.fromSignal(self.hoverChanged))
+
     def enterEvent(self, event) -> None:  # type: ignore[override]
         if not self._hovered:
             self._hovered = True
-            self.hoverChanged.emit(True)
+            if self._has_hover_listeners():
+                self.hoverChanged.emit(True)
         super().enterEvent(event)
 
     def leaveEvent(self, event) -> None:  # type: ignore[override]
         if self._hovered:
             self._hovered = False
-            self.hoverChanged.emit(False)
+            if self._has_hover_listeners():
+                self.hoverChanged.emit(False)
         super().leaveEvent(event)
 
 
 class FlowLayout(QLayout):
+    _HFW_CACHE_SIZE = 8
+
     def __init__(self, parent: QWidget | None = None, margin: int = 0, spacing: int = -1) -> None:
         super().__init__(parent)
         self.item_list: list[QLayoutItem] = []
+        self._hfw_cache: OrderedDict[int, int] = OrderedDict()
+        self._cached_spacing = 8
+        self._cached_margins = (margin, margin, margin, margin)
         self.setContentsMargins(margin, margin, margin, margin)
         self.setSpacing(spacing if spacing >= 0 else 8)
 
     def addItem(self, item) -> None:  # type: ignore[override]
         self.item_list.append(item)
+        self._hfw_cache.clear()
+
+    def setSpacing(self, spacing: int) -> None:  # type: ignore[override]
+        super().setSpacing(spacing)
+        self._cached_spacing = super().spacing()
+        self._hfw_cache.clear()
+
+    def setContentsMargins(self, *args) -> None:  # type: ignore[override]
+        super().setContentsMargins(*args)
+        self._cached_margins = super().getContentsMargins()
+        self._hfw_cache.clear()
+
+    def invalidate(self) -> None:  # type: ignore[override]
+        self._hfw_cache.clear()
+        super().invalidate()
 
     def addStretch(self, stretch: int = 0) -> None:
         spacer = QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Minimum)
@@ -70,6 +104,7 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index: int):  # type: ignore[override]
         if 0 <= index < len(self.item_list):
+            self._hfw_cache.clear()
             return self.item_list.pop(index)
         return None
 
@@ -80,7 +115,16 @@ class FlowLayout(QLayout):
         return True
 
     def heightForWidth(self, width: int) -> int:  # type: ignore[override]
-        return self._do_layout(QRectF(0, 0, width, 0), True)
+        cache = self._hfw_cache
+        height = cache.get(width)
+        if height is not None:
+            cache.move_to_end(width)
+            return height
+        height = self._do_layout(QRect(0, 0, width, 0), True)
+        cache[width] = height
+        if len(cache) > self._HFW_CACHE_SIZE:
+            cache.popitem(last=False)
+        return height
 
     def setGeometry(self, rect) -> None:  # type: ignore[override]
         super().setGeometry(rect)
@@ -93,32 +137,36 @@ class FlowLayout(QLayout):
         size = QSize()
         for item in self.item_list:
             size = size.expandedTo(item.minimumSize())
-        left, top, right, bottom = self.getContentsMargins()
+        left, top, right, bottom = self._cached_margins
         size += QSize(left + right, top + bottom)
         return size
 
     def _do_layout(self, rect, test_only: bool) -> int:
-        spacing = self.spacing()
-        left, top, right, bottom = self.getContentsMargins()
-        effective_rect = QRectF(
-            rect.x() + left, rect.y() + top, rect.width() - left - right, rect.height() - top - bottom
-        )
-        x = effective_rect.x()
-        y = effective_rect.y()
+        spacing = self._cached_spacing
+        left, top, right, bottom = self._cached_margins
+        ex = rect.x() + left
+        ey = rect.y() + top
+        ew = rect.width() - left - right
+        x = ex
+        y = ey
+        right_edge = ex + ew
         line_height = 0
 
-        for item in self.item_list:
-            next_x = x + item.sizeHint().width() + spacing
-            if next_x - spacing > effective_rect.right() and line_height > 0:
-                x = effective_rect.x()
+        hints = [(item, item.sizeHint()) for item in self.item_list]
+        for item, hint in hints:
+            hint_width = hint.width()
+            hint_height = hint.height()
+            next_x = x + hint_width + spacing
+            if next_x - spacing > right_edge and line_height > 0:
+                x = ex
                 y = y + line_height + spacing
-                next_x = x + item.sizeHint().width() + spacing
+                next_x = x + hint_width + spacing
                 line_height = 0
 
             if not test_only:
-                item.setGeometry(QRect(int(x), int(y), item.sizeHint().width(), item.sizeHint().height()))
+                item.setGeometry(QRect(x, y, hint_width, hint_height))
 
             x = next_x
-            line_height = max(line_height, item.sizeHint().height())
+            line_height = max(line_height, hint_height)
 
-        return int(y + line_height - rect.y() + bottom)
+        return y + line_height - rect.y() + bottom
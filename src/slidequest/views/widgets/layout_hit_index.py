@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+from PySide6.QtCore import QLineF, QPointF, QRect, QRectF
+
+from slidequest.models.layouts import parse_layout_description
+
+
+@lru_cache(maxsize=64)
+def layout_area_rects(
+    layout_description: str, width: int, height: int, padding: int
+) -> tuple[tuple[int, QRectF], ...]:
+    # Shared by every canvas (layout cards, editor, presentation); callers must not mutate the rects.
+    bounds = QRectF(padding, padding, width - 2 * padding, height - 2 * padding)
+    area_width = max(bounds.width(), 1.0)
+    area_height = max(bounds.height(), 1.0)
+    rects: list[tuple[int, QRectF]] = []
+    for index, cell in enumerate(parse_layout_description(layout_description)):
+        area_id = cell.area_id if cell.area_id > 0 else (index + 1)
+        cell_rect = QRectF(
+            bounds.x() + cell.x * area_width,
+            bounds.y() + cell.y * area_height,
+            cell.width * area_width,
+            cell.height * area_height,
+        )
+        rects.append((area_id, cell_rect))
+    return tuple(rects)
+
+
+@lru_cache(maxsize=64)
+def layout_border_lines(layout_description: str, width: int, height: int, padding: int) -> tuple[QLineF, ...]:
+    """Area outlines as line segments, with edges shared by neighbouring cells stored once."""
+    lines: dict[tuple[float, float, float, float], QLineF] = {}
+    for _, rect in layout_area_rects(layout_description, width, height, padding):
+        left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
+        for edge in (
+            (left, top, right, top),
+            (left, bottom, right, bottom),
+            (left, top, left, bottom),
+            (right, top, right, bottom),
+        ):
+            if edge not in lines:
+                lines[edge] = QLineF(*edge)
+    return tuple(lines.values())
+
+
+class AreaHitIndex:
+    """Area ids and edges as parallel numpy arrays for hit tests and paint culling."""
+
+    def __init__(self, area_rects: Sequence[tuple[int, QRectF]] = ()) -> None:
+        self._area_rects = list(area_rects)
+        self._rect_map: dict[int, QRectF] = {}
+        for area_id, rect in self._area_rects:
+            self._rect_map.setdefault(area_id, rect)
+        self._ids = np.array([area_id for area_id, _ in self._area_rects], dtype=np.int32)
+        # (left, top, right, bottom) rows parallel to the area list.
+        self._edges = np.array(
+            [(rect.x(), rect.y(), rect.x() + rect.width(), rect.y() + rect.height()) for _, rect in self._area_rects],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+
+    def area_at(self, x: float, y: float) -> int:
+        edges = self._edges
+        # Edges are inclusive, so a point on a shared border belongs to the first area.
+        mask = (edges[:, 0] <= x) & (x <= edges[:, 2]) & (edges[:, 1] <= y) & (y <= edges[:, 3])
+        if not mask.any():
+            return -1
+        return int(self._ids[int(mask.argmax())])
+
+    def intersecting(self, dirty: QRectF) -> list[tuple[int, QRectF]]:
+        if dirty.isEmpty():
+            return []
+        edges = self._edges
+        mask = (
+            (edges[:, 0] < dirty.right())
+            & (edges[:, 2] > dirty.left())
+            & (edges[:, 1] < dirty.bottom())
+            & (edges[:, 3] > dirty.top())
+        )
+        return [self._area_rects[index] for index in np.flatnonzero(mask)]
+
+    def rect_for(self, area_id: int) -> QRectF | None:
+        return self._rect_map.get(area_id)
+
+
+def token_paint_rect(rect: QRectF, rotation_deg: float, pad: float) -> QRect:
+    # Rotated tokens can reach their circumscribed circle; handles overhang the outline.
+    half_width = rect.width() / 2
+    half_height = rect.height() / 2
+    if rotation_deg:
+        half_width = half_height = math.hypot(half_width, half_height)
+    center = rect.center()
+    return QRectF(
+        center.x() - half_width - pad,
+        center.y() - half_height - pad,
+        2 * (half_width + pad),
+        2 * (half_height + pad),
+    ).toAlignedRect()
+
+
+def corner_points(rect: QRectF) -> dict[str, QPointF]:
+    return {
+        "top_left": rect.topLeft(),
+        "top_right": rect.topRight(),
+        "bottom_left": rect.bottomLeft(),
+        "bottom_right": rect.bottomRight(),
+    }
+
+
+def anchor_point(rect: QRectF, handle: str) -> QPointF:
+    """Corner opposite ``handle``, which stays fixed while that handle is dragged."""
+    mapping = {
+        "top_left": rect.bottomRight(),
+        "top_right": rect.bottomLeft(),
+        "bottom_left": rect.topRight(),
+        "bottom_right": rect.topLeft(),
+    }
+    return mapping.get(handle, rect.center())
+
+
+def token_at(
+    handle_coords: Sequence[tuple[str, str, float, float, float, float]],
+    token_coords: Sequence[tuple[str, float, float, float, float]],
+    x: float,
+    y: float,
+) -> tuple[str | None, str | None]:
+    # Handles win over token bodies; later tokens paint on top, so they are tested first.
+    for token_id, name, x0, y0, x1, y1 in handle_coords:
+        if x0 <= x <= x1 and y0 <= y <= y1:
+            return token_id, name
+    for token_id, x0, y0, x1, y1 in reversed(token_coords):
+        if x0 <= x <= x1 and y0 <= y <= y1:
+            return token_id, None
+    return None, None
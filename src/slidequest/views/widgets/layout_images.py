@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import os
+from typing import Callable
+
+from PySide6.QtCore import QObject, QPointF, QRectF, QRunnable, QSize, Qt, Signal
+from PySide6.QtGui import QGuiApplication, QImage, QPalette, QPixmap, QPixmapCache
+from PySide6.QtWidgets import QWidget
+
+# Targets smaller than this (device pixels, longest side) always use nearest-neighbour scaling.
+SMOOTH_SCALE_MIN_SIZE = 256
+# Granularity (device pixels) of the shared pre-scaled token pixmaps.
+TOKEN_SIZE_BUCKET = 16
+# Smaller images decode inline; larger ones go to the thread pool and paint once ready.
+ASYNC_DECODE_MIN_BYTES = 512 * 1024
+# Used when no screen is available to size the source-image cap.
+FALLBACK_SOURCE_CAP = QSize(3840, 2160)
+
+# (source cacheKey, area rect, device pixel ratio, scaled image, source rect, draw origin)
+ScaledArea = tuple[int, QRectF, float, QImage, QRectF, QPointF]
+
+
+def source_size_cap() -> QSize:
+    # Areas never exceed the largest screen, so bigger sources are only extra scaling work.
+    screens = QGuiApplication.screens()
+    if not screens:
+        return FALLBACK_SOURCE_CAP
+    width = height = 0
+    for screen in screens:
+        size = screen.size() * screen.devicePixelRatio()
+        width = max(width, size.width())
+        height = max(height, size.height())
+    return QSize(width, height)
+
+
+def decode_image(path: str, cap: QSize) -> QImage:
+    image = QImage(path)
+    if image.isNull():
+        return image
+    # Areas scale their source to cover, so the cap only has to stay covered; never upscale.
+    factor = max(cap.width() / image.width(), cap.height() / image.height())
+    if factor < 1:
+        size = QSize(max(1, round(image.width() * factor)), max(1, round(image.height() * factor)))
+        image = image.scaled(size, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    return image
+
+
+def source_stat(path: str) -> tuple[str, int]:
+    """QPixmapCache key and byte size of a source image; the key changes when the file does."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"source:{path}", 0
+    return f"source:{path}:{stat.st_mtime_ns}", stat.st_size
+
+
+def dropped_image_path(mime) -> str | None:
+    if mime.hasUrls():
+        for url in mime.urls():
+            if url.isLocalFile():
+                return url.toLocalFile()
+            if url.toString():
+                return url.toString()
+    if mime.hasText():
+        text = mime.text().strip()
+        if text:
+            return text
+    return None
+
+
+def cached_pixmap(key: str) -> QPixmap | None:
+    """Source pixmap for a ``source_stat`` key if it is already decoded, otherwise ``None``."""
+    return QPixmapCache.find(key)
+
+
+def pixmap_from_decoded(key: str, image: QImage) -> QPixmap:
+    """Share a pool-decoded image, preferring a copy another canvas cached meanwhile."""
+    if image.isNull():
+        return QPixmap()
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def load_pixmap(path: str) -> QPixmap:
+    key, _ = source_stat(path)
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap.fromImage(decode_image(path, source_size_cap()))
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def compositing_image(pixmap: QPixmap) -> QImage:
+    # RGB32 and premultiplied ARGB32 are the raster engine's blend fast paths.
+    image = pixmap.toImage()
+    if image.hasAlphaChannel():
+        return image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    return image.convertToFormat(QImage.Format.Format_RGB32)
+
+
+def scale_area_image(
+    source_key: int,
+    rect: QRectF,
+    image: QImage,
+    mode: Qt.TransformationMode,
+    dpr: float,
+) -> ScaledArea | None:
+    if image.isNull():
+        return None
+    # Scale straight to backing-store pixels so Hi-DPI blits need no second resample.
+    target_width = rect.width() * dpr
+    target_height = rect.height() * dpr
+    target_size = QSize(int(target_width), int(target_height))
+    if target_size.width() <= 0 or target_size.height() <= 0:
+        return None
+    scaled = image.scaled(
+        target_size,
+        Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+        mode,
+    )
+    scaled.setDevicePixelRatio(dpr)
+    offset_x = max((scaled.width() - target_width) / 2, 0)
+    offset_y = max((scaled.height() - target_height) / 2, 0)
+    source_rect = QRectF(offset_x, offset_y, target_width, target_height)
+    return source_key, QRectF(rect), dpr, scaled, source_rect, rect.topLeft()
+
+
+def _token_bucket(length: int) -> int:
+    return max(TOKEN_SIZE_BUCKET, round(length / TOKEN_SIZE_BUCKET) * TOKEN_SIZE_BUCKET)
+
+
+def scaled_token_pixmap(pixmap: QPixmap, size: QSize, dpr: float) -> QPixmap:
+    # Device sizes snap to buckets so tokens passing through similar sizes (drags, window
+    # resizes) share one pre-scaled copy in QPixmapCache across canvases.
+    bucket = QSize(_token_bucket(int(size.width() * dpr)), _token_bucket(int(size.height() * dpr)))
+    if max(bucket.width(), bucket.height()) < SMOOTH_SCALE_MIN_SIZE:
+        mode = Qt.TransformationMode.FastTransformation
+    else:
+        mode = Qt.TransformationMode.SmoothTransformation
+    key = f"token:{pixmap.cacheKey()}:{bucket.width()}x{bucket.height()}:{mode.value}"
+    scaled = QPixmapCache.find(key)
+    if scaled is None:
+        scaled = pixmap.scaled(bucket, Qt.AspectRatioMode.KeepAspectRatio, mode)
+        QPixmapCache.insert(key, scaled)
+    return scaled
+
+
+def render_layout_thumbnail(layout_description: str, size: QSize, canvas_factory: Callable[[str], QWidget]) -> QPixmap:
+    """Render a static layout preview once and share it through QPixmapCache."""
+    layout_description = layout_description or "1S|100/1R|100"
+    screen = QGuiApplication.primaryScreen()
+    dpr = screen.devicePixelRatio() if screen is not None else 1.0
+    # The canvas below is disabled, so it paints the Disabled Window colour; keying on exactly
+    # that colour rebuilds the thumbnail after theme changes.
+    background = QGuiApplication.palette().color(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Window)
+    key = f"layout::{layout_description}::{size.width()}x{size.height()}::{dpr}::{background.rgba():08x}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        canvas = canvas_factory(layout_description)
+        canvas.setEnabled(False)
+        canvas.setFixedSize(size)
+        pixmap = canvas.grab()
+        canvas.deleteLater()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class ImageDecodeSignals(QObject):
+    # path, source_stat cache key taken before decoding, image
+    decoded = Signal(str, str, QImage)
+
+
+class ImageDecodeRunnable(QRunnable):
+    """Decodes an image file into a QImage on a pool thread (QPixmap is GUI-thread only)."""
+
+    def __init__(self, path: str, key: str, cap: QSize, signals: ImageDecodeSignals) -> None:
+        super().__init__()
+        self._path = path
+        self._key = key
+        self._cap = cap
+        self._signals = signals
+
+    def run(self) -> None:  # type: ignore[override]
+        self._signals.decoded.emit(self._path, self._key, decode_image(self._path, self._cap))
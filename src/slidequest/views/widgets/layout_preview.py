@@ -1,9 +1,30 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 
-from PySide6.QtCore import QPoint, QPointF, QRectF, Qt, Signal
-from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
+from PySide6.QtCore import (
+    QEvent,
+    QLineF,
+    QPoint,
+    QPointF,
+    QRect,
+    QRectF,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QImage,
+    QPainter,
+    QPen,
+    QPixmap,
+    QRegion,
+)
 from PySide6.QtWidgets import (
     QFrame,
     QLabel,
@@ -12,13 +33,43 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from slidequest.models.layouts import LayoutCell, LayoutItem, parse_layout_description
+from slidequest.models.layouts import LayoutItem
+from slidequest.views.widgets.layout_hit_index import (
+    AreaHitIndex,
+    anchor_point,
+    corner_points,
+    layout_area_rects,
+    layout_border_lines,
+    token_at,
+    token_paint_rect,
+)
+from slidequest.views.widgets.layout_images import (
+    ASYNC_DECODE_MIN_BYTES,
+    SMOOTH_SCALE_MIN_SIZE,
+    ImageDecodeRunnable,
+    ImageDecodeSignals,
+    ScaledArea,
+    cached_pixmap,
+    compositing_image,
+    dropped_image_path,
+    load_pixmap,
+    pixmap_from_decoded,
+    render_layout_thumbnail,
+    scale_area_image,
+    scaled_token_pixmap,
+    source_size_cap,
+    source_stat,
+)
 
 
 TOKEN_MIME_TYPE = "application/x-slidequest-token"
 TOKEN_MIN_SIZE = 24.0
 TOKEN_BASE_RATIO = 0.18
 TOKEN_HANDLE_SIZE = 10.0
+SMOOTH_SCALE_DELAY_MS = 120
+# Interaction repaints are batched to at most one per display frame.
+REPAINT_INTERVAL_MS = 16
+LAYOUT_CARD_PREVIEW_SIZE = QSize(180, 110)
 
 
 @dataclass
@@ -51,16 +102,65 @@ class LayoutPreviewCanvas(QFrame):
         self._layout_description = layout_description or "1S|100/1R|100"
         self._accepts_drop = accepts_drop
         self._supports_tokens = supports_tokens
-        self._cells: list[LayoutCell] = []
         self._area_rects: list[tuple[int, QRectF]] = []
+        # Area outlines as line segments with edges shared by neighbouring cells stored once.
+        self._border_lines: list[QLineF] = []
+        # (width, height, layout) the current _area_rects were computed for.
+        self._area_rects_key: tuple[int, int, str] | None = None
+        self._hit_index = AreaHitIndex()
         self._image_paths: dict[int, str] = {}
         self._pixmaps: dict[int, QPixmap] = {}
+        # path -> area ids still waiting for their decode; replaced on every set_area_images.
+        self._pending_decodes: dict[str, list[int]] = {}
+        self._inflight_decodes: set[str] = set()
+        # Unparented: in-flight runnables keep it alive if the canvas is destroyed first.
+        self._decode_signals = ImageDecodeSignals()
+        self._decode_signals.decoded.connect(self._on_image_decoded)
+        # Source pixmap cacheKey -> image converted once for scaling/compositing.
+        self._source_images: dict[int, QImage] = {}
+        self._scaled_cache: dict[int, ScaledArea] = {}
+        self._scaling_mode = Qt.TransformationMode.SmoothTransformation
+        self._fast_scaled = False
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(SMOOTH_SCALE_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._restore_smooth_scaling)
         self._highlight_area: int = -1
+        self._pending_repaint = QRegion()
+        self._pending_full_repaint = False
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(REPAINT_INTERVAL_MS)
+        self._repaint_timer.timeout.connect(self._flush_repaint)
+        # Drag-move hit tests are coalesced to one per event-loop pass.
+        self._pending_move_pos: QPoint | None = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(0)
+        self._move_timer.timeout.connect(self._process_pending_move)
         self._padding = 8
+        self._border_pen = QPen(QColor(0, 0, 0))
+        self._border_pen.setWidthF(1.0)
+        self._outline_pen = QPen(QColor(255, 255, 255, 190))
+        self._outline_pen.setStyle(Qt.PenStyle.DashLine)
+        self._outline_pen.setWidth(2)
+        self._handle_brush = QBrush(QColor(255, 255, 255, 210))
+        self._active_handle_brush = QBrush(QColor(255, 200, 120, 220))
+        self._highlight_color = QColor(255, 255, 255, 32)
+        self._background_color = QColor()
+        self._refresh_background_color()
         self._token_instances: dict[str, CanvasTokenInstance] = {}
         self._token_order: list[str] = []
         self._token_rects: dict[str, QRectF] = {}
         self._token_handles: dict[str, dict[str, QRectF]] = {}
+        # Plain (id, left, top, right, bottom) edges of the rects above in paint order, so
+        # mouse-move hit tests compare floats instead of converting points for QRectF.contains.
+        self._token_hit_coords: list[tuple[str, float, float, float, float]] = []
+        self._handle_hit_coords: list[tuple[str, str, float, float, float, float]] = []
+        # Handle rects of the selected token, reused while its (id, rect) key is unchanged.
+        self._cached_handle_key: tuple[str, float, float, float, float] | None = None
+        self._cached_handles: dict[str, QRectF] = {}
+        self._cached_handle_coords: list[tuple[str, str, float, float, float, float]] = []
         self._selected_token: str | None = None
         self._drag_mode: str | None = None
         self._drag_token_id: str | None = None
@@ -68,14 +168,16 @@ class LayoutPreviewCanvas(QFrame):
         self._drag_start_pos = QPoint()
         self._drag_start_center = QPointF()
         self._drag_start_scale = 1.0
+        self._drag_start_base_size = TOKEN_MIN_SIZE
 
         self.setMinimumSize(200, 140)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        # paintEvent fills every dirty pixel itself, so Qt can skip the background erase.
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAutoFillBackground(False)
         if accepts_drop or supports_tokens:
             self.setAcceptDrops(True)
 
-        self._parse_layout()
-
     # ------------------------------------------------------------------ #
     # Public API
     # ------------------------------------------------------------------ #
@@ -84,27 +186,54 @@ class LayoutPreviewCanvas(QFrame):
         if layout_description == self._layout_description:
             return
         self._layout_description = layout_description
-        self._parse_layout()
+        self._scaled_cache.clear()
         self.update()
 
     def layout_description(self) -> str:
         return self._layout_description
 
-    def set_area_images(self, images: dict[int, str] | None) -> None:
-        self._image_paths.clear()
-        self._pixmaps.clear()
-        if images:
-            for area_id, path in images.items():
-                normalized = str(path).strip()
-                if not normalized:
-                    continue
-                pixmap = QPixmap(normalized)
-                if pixmap.isNull():
-                    continue
-                self._image_paths[area_id] = normalized
-                self._pixmaps[area_id] = pixmap
+    def set_area_images(self, images: Mapping[int, str] | None) -> None:
+        normalized: dict[int, str] = {}
+        for area_id, path in (images or {}).items():
+            value = str(path).strip()
+            if value:
+                normalized[int(area_id)] = value
+        if normalized == self._image_paths:
+            return
+        self._image_paths = normalized
+        self._pixmaps = {}
+        self._source_images = {}
+        self._pending_decodes = {}
+        self._scaled_cache.clear()
+        pool = QThreadPool.globalInstance()
+        cap = source_size_cap()
+        for area_id, path in normalized.items():
+            key, size = source_stat(path)
+            pixmap = cached_pixmap(key)
+            if pixmap is None and size < ASYNC_DECODE_MIN_BYTES:
+                pixmap = load_pixmap(path)
+            if pixmap is not None:
+                if not pixmap.isNull():
+                    self._pixmaps[area_id] = pixmap
+                continue
+            self._pending_decodes.setdefault(path, []).append(area_id)
+            if path not in self._inflight_decodes:
+                self._inflight_decodes.add(path)
+                pool.start(ImageDecodeRunnable(path, key, cap, self._decode_signals))
         self.update()
 
+    def finish_pending_loads(self) -> None:
+        """Decode outstanding images synchronously, e.g. before rendering a thumbnail."""
+        pending, self._pending_decodes = self._pending_decodes, {}
+        for path, area_ids in pending.items():
+            pixmap = load_pixmap(path)
+            if pixmap.isNull():
+                continue
+            for area_id in area_ids:
+                self._pixmaps[area_id] = pixmap
+        if pending:
+            self.update()
+
     def set_tokens(self, instances: list[CanvasTokenInstance] | None) -> None:
         if not self._supports_tokens:
             return
@@ -118,36 +247,52 @@ class LayoutPreviewCanvas(QFrame):
             self._selected_token = None
         self._token_rects.clear()
         self._token_handles.clear()
+        self._token_hit_coords = []
+        self._handle_hit_coords = []
         self.update()
 
     # ------------------------------------------------------------------ #
     # QWidget overrides
     # ------------------------------------------------------------------ #
     def paintEvent(self, event) -> None:  # type: ignore[override]
-        super().paintEvent(event)
+        # Highlight moves dirty two disjoint cells; clip to the region, not its bounding rect.
+        region = event.region()
+        dirty = region.boundingRect()
+        multi_rect = region.rectCount() > 1
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        painter.fillRect(self.rect(), self.palette().color(self.backgroundRole()))
-        self._area_rects = self._compute_area_rects()
+        painter.setClipRegion(region)
+        painter.fillRect(dirty, self._background_color)
+        self.drawFrame(painter)
+        self._ensure_area_rects()
         bounds = self._canvas_bounds()
 
-        pen = QPen(QColor("#000000"))
-        pen.setWidthF(1.0)
-        painter.setPen(pen)
-
-        for area_id, rect in self._area_rects:
+        for area_id, rect in self._visible_area_rects(QRectF(dirty)):
+            if multi_rect and not region.intersects(rect.toAlignedRect()):
+                continue
             if area_id in self._pixmaps:
-                self._draw_pixmap(painter, rect, self._pixmaps[area_id])
+                self._draw_pixmap(painter, area_id, rect, self._pixmaps[area_id])
             if area_id == self._highlight_area:
-                painter.fillRect(rect, QColor(255, 255, 255, 32))
-            painter.drawRect(rect)
+                painter.fillRect(rect, self._highlight_color)
+        # Borders go last so a neighbour's image can't cover them; the clip region culls them.
+        painter.setPen(self._border_pen)
+        painter.drawLines(self._border_lines)
 
         if self._supports_tokens and self._token_order:
-            self._draw_tokens(painter, bounds)
+            self._draw_tokens(painter, bounds, region)
+
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.EnabledChange, QEvent.Type.ActivationChange):
+            self._refresh_background_color()
+        super().changeEvent(event)
+
+    def _refresh_background_color(self) -> None:
+        # QWidget.palette() selects the colour group for the current enabled/active state.
+        self._background_color = self.palette().color(self.backgroundRole())
 
     def resizeEvent(self, event) -> None:  # type: ignore[override]
         super().resizeEvent(event)
-        self._area_rects = self._compute_area_rects()
+        self._area_rects_key = None
+        self._begin_fast_scaling()
 
     def dragEnterEvent(self, event) -> None:  # type: ignore[override]
         if self._supports_tokens and self._has_token_payload(event.mimeData()):
@@ -158,7 +303,7 @@ class LayoutPreviewCanvas(QFrame):
         if not self._accepts_drop:
             event.ignore()
             return
-        if self._extract_drop_path(event.mimeData()):
+        if dropped_image_path(event.mimeData()):
             event.acceptProposedAction()
         else:
             event.ignore()
@@ -172,14 +317,19 @@ class LayoutPreviewCanvas(QFrame):
         if not self._accepts_drop:
             event.ignore()
             return
-        area_id = self._hit_test_area(event.position().toPoint())
-        self._set_highlight_area(area_id)
-        if area_id > 0:
+        self._begin_fast_scaling()
+        pos = event.position().toPoint()
+        self._pending_move_pos = pos
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+        # Cells tile the padded bounds, so this matches the deferred area hit test.
+        if self._canvas_bounds().contains(pos):
             event.acceptProposedAction()
         else:
             event.ignore()
 
     def dragLeaveEvent(self, event) -> None:  # type: ignore[override]
+        self._cancel_pending_move()
         if self._highlight_area != -1:
             self._set_highlight_area(-1)
         event.accept()
@@ -197,8 +347,9 @@ class LayoutPreviewCanvas(QFrame):
         if not self._accepts_drop:
             event.ignore()
             return
+        self._cancel_pending_move()
         area_id = self._hit_test_area(event.position().toPoint())
-        source = self._extract_drop_path(event.mimeData())
+        source = dropped_image_path(event.mimeData())
         self._set_highlight_area(-1)
         if area_id > 0 and source:
             event.acceptProposedAction()
@@ -233,6 +384,7 @@ class LayoutPreviewCanvas(QFrame):
         rect = self._token_rects.get(token_id, QRectF())
         self._drag_start_center = rect.center()
         self._drag_start_scale = instance.scale
+        self._drag_start_base_size = self._token_base_size(self._canvas_bounds())
         if handle:
             self._drag_mode = "resize"
         else:
@@ -253,7 +405,7 @@ class LayoutPreviewCanvas(QFrame):
             self._update_token_position(instance, bounds, event)
         elif self._drag_mode == "resize" and self._drag_handle:
             self._update_token_scale(instance, bounds, event)
-        self.update()
+        self._schedule_token_repaint(instance, bounds)
 
     def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
         if not self._supports_tokens or not self._drag_mode or not self._drag_token_id:
@@ -270,107 +422,209 @@ class LayoutPreviewCanvas(QFrame):
         self._drag_mode = None
         self._drag_token_id = None
         self._drag_handle = None
-        self.update()
+        if instance is not None:
+            self._schedule_token_repaint(instance, self._canvas_bounds())
+        else:
+            self._schedule_repaint()
 
     # ------------------------------------------------------------------ #
     # Helpers
     # ------------------------------------------------------------------ #
-    def _parse_layout(self) -> None:
-        self._cells = parse_layout_description(self._layout_description)
-        self._area_rects = self._compute_area_rects()
-
-    def _compute_area_rects(self) -> list[tuple[int, QRectF]]:
-        rects: list[tuple[int, QRectF]] = []
-        bounds = self.rect().adjusted(self._padding, self._padding, -self._padding, -self._padding)
-        width = max(bounds.width(), 1.0)
-        height = max(bounds.height(), 1.0)
-        for index, cell in enumerate(self._cells):
-            area_id = cell.area_id if cell.area_id > 0 else (index + 1)
-            cell_rect = QRectF(
-                bounds.x() + cell.x * width,
-                bounds.y() + cell.y * height,
-                cell.width * width,
-                cell.height * height,
+    def _on_image_decoded(self, path: str, key: str, image: QImage) -> None:
+        self._inflight_decodes.discard(path)
+        pixmap = pixmap_from_decoded(key, image)
+        # Results for paths the current image set no longer wants are only cached.
+        area_ids = self._pending_decodes.pop(path, None)
+        if not area_ids or pixmap.isNull():
+            return
+        for area_id in area_ids:
+            self._pixmaps[area_id] = pixmap
+            self._update_area(area_id)
+
+    def _ensure_area_rects(self) -> None:
+        key = (self.width(), self.height(), self._layout_description)
+        if key != self._area_rects_key:
+            self._area_rects = list(
+                layout_area_rects(self._layout_description, self.width(), self.height(), self._padding)
+            )
+            self._border_lines = list(
+                layout_border_lines(self._layout_description, self.width(), self.height(), self._padding)
             )
-            rects.append((area_id, cell_rect))
-        return rects
+            self._area_rects_key = key
+            self._hit_index = AreaHitIndex(self._area_rects)
+
+    def _visible_area_rects(self, dirty: QRectF) -> list[tuple[int, QRectF]]:
+        return self._hit_index.intersecting(dirty)
+
+    def _draw_pixmap(self, painter: QPainter, area_id: int, rect: QRectF, pixmap: QPixmap) -> None:
+        dpr = self.devicePixelRatioF()
+        source_key = pixmap.cacheKey()
+        cached = self._scaled_cache.get(area_id)
+        if cached is None or cached[0] != source_key or cached[1] != rect or cached[2] != dpr:
+            image = self._source_images.get(source_key)
+            if image is None:
+                image = compositing_image(pixmap)
+                self._source_images[source_key] = image
+            small = max(rect.width(), rect.height()) * dpr < SMOOTH_SCALE_MIN_SIZE
+            mode = Qt.TransformationMode.FastTransformation if small else self._scaling_mode
+            cached = scale_area_image(source_key, rect, image, mode, dpr)
+            if cached is None:
+                return
+            self._scaled_cache[area_id] = cached
+            # Small targets are final already; only interactive fast scales need the smooth upgrade.
+            if mode == Qt.TransformationMode.FastTransformation and not small:
+                self._fast_scaled = True
+        painter.drawImage(cached[5], cached[3], cached[4])
+
+    def _begin_fast_scaling(self) -> None:
+        # Interactive resizes/drags scale with nearest-neighbour; a short idle upgrades to smooth.
+        self._scaling_mode = Qt.TransformationMode.FastTransformation
+        self._smooth_timer.start()
+
+    def _restore_smooth_scaling(self) -> None:
+        self._scaling_mode = Qt.TransformationMode.SmoothTransformation
+        if self._fast_scaled:
+            self._fast_scaled = False
+            self._scaled_cache.clear()
+            self.update()
 
-    def _draw_pixmap(self, painter: QPainter, rect: QRectF, pixmap: QPixmap) -> None:
-        if pixmap.isNull():
-            return
-        target_size = rect.size().toSize()
-        if target_size.width() <= 0 or target_size.height() <= 0:
-            return
-        scaled = pixmap.scaled(
-            target_size,
-            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        offset_x = max((scaled.width() - rect.width()) / 2, 0)
-        offset_y = max((scaled.height() - rect.height()) / 2, 0)
-        source_rect = QRectF(offset_x, offset_y, rect.width(), rect.height())
-        painter.drawPixmap(rect.topLeft(), scaled, source_rect)
+    def _process_pending_move(self) -> None:
+        pos = self._pending_move_pos
+        self._pending_move_pos = None
+        if pos is not None:
+            self._set_highlight_area(self._hit_test_area(pos))
+
+    def _cancel_pending_move(self) -> None:
+        self._move_timer.stop()
+        self._pending_move_pos = None
 
     def _hit_test_area(self, point: QPoint) -> int:
-        for area_id, rect in self._area_rects:
-            if rect.contains(point):
-                return area_id
-        return -1
+        self._ensure_area_rects()
+        return self._hit_index.area_at(point.x(), point.y())
 
     def _set_highlight_area(self, area_id: int) -> None:
         if self._highlight_area == area_id:
             return
+        previous = self._highlight_area
         self._highlight_area = area_id
-        self.update()
-
-    def _draw_tokens(self, painter: QPainter, bounds: QRectF) -> None:
+        self._update_area(previous)
+        self._update_area(area_id)
+
+    def _update_area(self, area_id: int) -> None:
+        rect = self._rect_for(area_id)
+        if not rect.isEmpty():
+            self._schedule_repaint(rect)
+
+    def _schedule_repaint(self, rect: QRect | None = None) -> None:
+        """Queue a repaint of ``rect`` (or everything) for the next frame tick."""
+        if rect is None:
+            self._pending_full_repaint = True
+        elif not self._pending_full_repaint:
+            self._pending_repaint = self._pending_repaint.united(rect)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _schedule_token_repaint(self, instance: CanvasTokenInstance, bounds: QRectF) -> None:
+        # Union of where the token was last painted and where it goes now, outline included.
+        rotation = instance.rotation_deg
+        rect = token_paint_rect(self._token_rect(instance, bounds), rotation, TOKEN_HANDLE_SIZE)
+        previous = self._token_rects.get(instance.placement_id)
+        if previous is not None:
+            rect = rect.united(token_paint_rect(previous, rotation, TOKEN_HANDLE_SIZE))
+        self._schedule_repaint(rect)
+
+    def _flush_repaint(self) -> None:
+        if self._pending_full_repaint:
+            self.update()
+        elif not self._pending_repaint.isEmpty():
+            self.update(self._pending_repaint)
+        self._pending_full_repaint = False
+        self._pending_repaint = QRegion()
+
+    def _rect_for(self, area_id: int) -> QRect:
+        """Device rect covering an area and its border, or an empty QRect."""
+        if area_id <= 0:
+            return QRect()
+        self._ensure_area_rects()
+        rect = self._hit_index.rect_for(area_id)
+        if rect is None:
+            return QRect()
+        return rect.toAlignedRect().adjusted(-1, -1, 1, 1)
+
+    def _draw_tokens(self, painter: QPainter, bounds: QRectF, dirty: QRegion) -> None:
         self._token_rects.clear()
         self._token_handles.clear()
+        self._token_hit_coords = []
+        self._handle_hit_coords = []
+        dpr = self.devicePixelRatioF()
         for token_id in self._token_order:
             instance = self._token_instances.get(token_id)
             if instance is None or instance.pixmap.isNull():
                 continue
             rect = self._token_rect(instance, bounds)
+            # Geometry is recorded for hit tests even when the paint itself is culled.
             self._token_rects[token_id] = rect
+            self._token_hit_coords.append((token_id, rect.left(), rect.top(), rect.right(), rect.bottom()))
+            selected = token_id == self._selected_token
+            if selected:
+                self._token_handles[token_id] = self._handle_rects(token_id, rect)
+                self._handle_hit_coords = self._cached_handle_coords
+            if not dirty.intersects(token_paint_rect(rect, instance.rotation_deg, TOKEN_HANDLE_SIZE if selected else 1.0)):
+                continue
             painter.save()
             center = rect.center()
             painter.translate(center)
             if instance.rotation_deg:
+                # The rotation resamples anyway: draw the source straight into the target
+                # rect instead of pre-scaling it first.
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+                if max(rect.width(), rect.height()) * dpr >= SMOOTH_SCALE_MIN_SIZE:
+                    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
                 painter.rotate(instance.rotation_deg)
-            draw_rect = QRectF(-rect.width() / 2, -rect.height() / 2, rect.width(), rect.height())
-            scaled = instance.pixmap.scaled(
-                rect.size().toSize(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            painter.drawPixmap(draw_rect.topLeft(), scaled)
+                source = instance.pixmap
+                fitted = source.size().scaled(rect.size().toSize(), Qt.AspectRatioMode.KeepAspectRatio)
+                target = QRectF(-rect.width() / 2, -rect.height() / 2, fitted.width(), fitted.height())
+                painter.drawPixmap(target, source, QRectF(source.rect()))
+            else:
+                scaled = scaled_token_pixmap(instance.pixmap, rect.size().toSize(), dpr)
+                fitted = instance.pixmap.size().scaled(rect.size().toSize(), Qt.AspectRatioMode.KeepAspectRatio)
+                target = QRectF(-rect.width() / 2, -rect.height() / 2, fitted.width(), fitted.height())
+                if max(fitted.width(), fitted.height()) * dpr >= SMOOTH_SCALE_MIN_SIZE:
+                    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+                painter.drawPixmap(target, scaled, QRectF(scaled.rect()))
             painter.restore()
-            if token_id == self._selected_token:
-                self._draw_token_outline(painter, rect)
-
-    def _draw_token_outline(self, painter: QPainter, rect: QRectF) -> None:
+            if selected:
+                self._draw_token_outline(painter, rect, self._token_handles[token_id])
+
+    def _handle_rects(self, token_id: str, rect: QRectF) -> dict[str, QRectF]:
+        key = (token_id, rect.x(), rect.y(), rect.width(), rect.height())
+        if key != self._cached_handle_key:
+            self._cached_handles = {
+                name: QRectF(
+                    corner.x() - TOKEN_HANDLE_SIZE / 2,
+                    corner.y() - TOKEN_HANDLE_SIZE / 2,
+                    TOKEN_HANDLE_SIZE,
+                    TOKEN_HANDLE_SIZE,
+                )
+                for name, corner in corner_points(rect).items()
+            }
+            self._cached_handle_coords = [
+                (token_id, name, handle.left(), handle.top(), handle.right(), handle.bottom())
+                for name, handle in self._cached_handles.items()
+            ]
+            self._cached_handle_key = key
+        return self._cached_handles
+
+    def _draw_token_outline(self, painter: QPainter, rect: QRectF, handle_map: dict[str, QRectF]) -> None:
         painter.save()
-        outline = QPen(QColor(255, 255, 255, 190))
-        outline.setStyle(Qt.PenStyle.DashLine)
-        outline.setWidth(2)
-        painter.setPen(outline)
+        painter.setPen(self._outline_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRect(rect)
-        handle_map: dict[str, QRectF] = {}
-        for name, corner in self._token_handle_points(rect).items():
-            handle_rect = QRectF(
-                corner.x() - TOKEN_HANDLE_SIZE / 2,
-                corner.y() - TOKEN_HANDLE_SIZE / 2,
-                TOKEN_HANDLE_SIZE,
-                TOKEN_HANDLE_SIZE,
-            )
-            painter.fillRect(handle_rect, QColor(255, 255, 255, 210))
-            painter.drawRect(handle_rect)
-            handle_map[name] = handle_rect
+        painter.setBrush(self._handle_brush)
+        painter.drawRects(list(handle_map.values()))
         if self._drag_token_id == self._selected_token and self._drag_handle and self._drag_handle in handle_map:
-            painter.fillRect(handle_map[self._drag_handle], QColor(255, 200, 120, 220))
+            painter.fillRect(handle_map[self._drag_handle], self._active_handle_brush)
         painter.restore()
-        self._token_handles[self._selected_token] = handle_map
 
     def _token_rect(self, instance: CanvasTokenInstance, bounds: QRectF) -> QRectF:
         base_size = self._token_base_size(bounds)
@@ -403,102 +657,68 @@ class LayoutPreviewCanvas(QFrame):
         return QPointF(max(0.0, min(1.0, x)), max(0.0, min(1.0, y)))
 
     def _hit_test_token(self, point: QPoint) -> tuple[str | None, str | None]:
-        # prioritize handles
-        for token_id, handles in self._token_handles.items():
-            for name, rect in handles.items():
-                if rect.contains(point):
-                    return token_id, name
-        for token_id in reversed(self._token_order):
-            rect = self._token_rects.get(token_id)
-            if rect and rect.contains(point):
-                return token_id, None
-        return None, None
+        return token_at(self._handle_hit_coords, self._token_hit_coords, point.x(), point.y())
 
     def _update_token_position(self, instance: CanvasTokenInstance, bounds: QRectF, event) -> None:
-        delta = event.position().toPoint() - self._drag_start_pos
-        norm_dx = delta.x() / max(bounds.width(), 1.0)
-        norm_dy = delta.y() / max(bounds.height(), 1.0)
-        new_x = self._drag_start_center.x() + norm_dx * bounds.width()
-        new_y = self._drag_start_center.y() + norm_dy * bounds.height()
-        clamped = self._clamp_point_to_bounds(QPointF(new_x, new_y), bounds, instance.scale)
-        instance.position_x = (clamped.x() - bounds.x()) / max(bounds.width(), 1.0)
-        instance.position_y = (clamped.y() - bounds.y()) / max(bounds.height(), 1.0)
+        point = event.position().toPoint()
+        start = self._drag_start_center
+        x, y = self._clamp_to_bounds(
+            start.x() + point.x() - self._drag_start_pos.x(),
+            start.y() + point.y() - self._drag_start_pos.y(),
+            bounds,
+            instance.scale,
+        )
+        instance.position_x = (x - bounds.x()) / max(bounds.width(), 1.0)
+        instance.position_y = (y - bounds.y()) / max(bounds.height(), 1.0)
 
     def _update_token_scale(self, instance: CanvasTokenInstance, bounds: QRectF, event) -> None:
-        pointer = self._clamp_point_to_bounds(event.position(), bounds, instance.scale)
-        modifiers = event.modifiers()
         if self._drag_handle is None:
             return
-        start_rect = self._token_rects.get(instance.placement_id, QRectF(self._drag_start_center.x(), self._drag_start_center.y(), 0, 0))
-        if start_rect.isNull():
-            start_rect = QRectF(
-                self._drag_start_center.x() - TOKEN_MIN_SIZE / 2,
-                self._drag_start_center.y() - TOKEN_MIN_SIZE / 2,
-                TOKEN_MIN_SIZE,
-                TOKEN_MIN_SIZE,
-            )
+        position = event.position()
+        pointer_x, pointer_y = self._clamp_to_bounds(position.x(), position.y(), bounds, instance.scale)
+        modifiers = event.modifiers()
+        center_x = self._drag_start_center.x()
+        center_y = self._drag_start_center.y()
         if modifiers & Qt.KeyboardModifier.ShiftModifier:
-            center = self._drag_start_center
-            half_size = max(abs(pointer.x() - center.x()), abs(pointer.y() - center.y()))
+            half_size = max(abs(pointer_x - center_x), abs(pointer_y - center_y))
             size = max(TOKEN_MIN_SIZE, half_size * 2)
-            new_center = center
+            new_x = center_x
+            new_y = center_y
         else:
-            anchor = self._anchor_point(start_rect, self._drag_handle)
-            width = abs(anchor.x() - pointer.x())
-            height = abs(anchor.y() - pointer.y())
+            start_rect = self._token_rects.get(instance.placement_id, QRectF(center_x, center_y, 0, 0))
+            if start_rect.isNull():
+                start_rect = QRectF(
+                    center_x - TOKEN_MIN_SIZE / 2,
+                    center_y - TOKEN_MIN_SIZE / 2,
+                    TOKEN_MIN_SIZE,
+                    TOKEN_MIN_SIZE,
+                )
+            anchor = anchor_point(start_rect, self._drag_handle)
+            anchor_x = anchor.x()
+            anchor_y = anchor.y()
+            width = abs(anchor_x - pointer_x)
+            height = abs(anchor_y - pointer_y)
             size = max(TOKEN_MIN_SIZE, width if width >= height else height)
-            new_center = QPointF((anchor.x() + pointer.x()) / 2, (anchor.y() + pointer.y()) / 2)
-        base_size = self._token_base_size(bounds)
-        scale = max(0.1, size / max(base_size, 1.0))
+            new_x = (anchor_x + pointer_x) / 2
+            new_y = (anchor_y + pointer_y) / 2
+        scale = max(0.1, size / max(self._drag_start_base_size, 1.0))
         if not (modifiers & Qt.KeyboardModifier.AltModifier):
             scale = max(0.5, round(scale / 0.5) * 0.5)
-        clamped_center = self._clamp_point_to_bounds(new_center, bounds, scale)
+        x, y = self._clamp_to_bounds(new_x, new_y, bounds, scale)
         instance.scale = scale
-        instance.position_x = (clamped_center.x() - bounds.x()) / max(bounds.width(), 1.0)
-        instance.position_y = (clamped_center.y() - bounds.y()) / max(bounds.height(), 1.0)
-
-    def _token_handle_points(self, rect: QRectF) -> dict[str, QPointF]:
-        return {
-            "top_left": rect.topLeft(),
-            "top_right": rect.topRight(),
-            "bottom_left": rect.bottomLeft(),
-            "bottom_right": rect.bottomRight(),
-        }
+        instance.position_x = (x - bounds.x()) / max(bounds.width(), 1.0)
+        instance.position_y = (y - bounds.y()) / max(bounds.height(), 1.0)
 
-    @staticmethod
-    def _anchor_point(rect: QRectF, handle: str) -> QPointF:
-        mapping = {
-            "top_left": rect.bottomRight(),
-            "top_right": rect.bottomLeft(),
-            "bottom_left": rect.topRight(),
-            "bottom_right": rect.topLeft(),
-        }
-        return mapping.get(handle, rect.center())
-
-    def _clamp_point_to_bounds(self, point: QPointF, bounds: QRectF, scale: float) -> QPointF:
-        size = max(TOKEN_MIN_SIZE, self._token_base_size(bounds) * max(scale, 0.1))
-        half = size / 2
-        x = max(bounds.left() + half, min(bounds.right() - half, point.x()))
-        y = max(bounds.top() + half, min(bounds.bottom() - half, point.y()))
-        return QPointF(x, y)
+    def _clamp_to_bounds(self, x: float, y: float, bounds: QRectF, scale: float) -> tuple[float, float]:
+        # Runs per mouse move during a gesture: plain floats, base size cached at press time.
+        half = max(TOKEN_MIN_SIZE, self._drag_start_base_size * max(scale, 0.1)) / 2
+        x = max(bounds.left() + half, min(bounds.right() - half, x))
+        y = max(bounds.top() + half, min(bounds.bottom() - half, y))
+        return x, y
 
     def _token_base_size(self, bounds: QRectF) -> float:
         return max(TOKEN_MIN_SIZE, min(bounds.width(), bounds.height()) * TOKEN_BASE_RATIO)
 
-    @staticmethod
-    def _extract_drop_path(mime) -> str | None:
-        if mime.hasUrls():
-            for url in mime.urls():
-                if url.isLocalFile():
-                    return url.toLocalFile()
-                if url.toString():
-                    return url.toString()
-        if mime.hasText():
-            text = mime.text().strip()
-            if text:
-                return text
-        return None
-
 
 class LayoutPreviewCard(QFrame):
     """Compact card with preview + metadata for quick layout selection."""
@@ -519,9 +739,9 @@ class LayoutPreviewCard(QFrame):
         wrapper.setContentsMargins(12, 12, 12, 12)
         wrapper.setSpacing(8)
 
-        self._preview = LayoutPreviewCanvas(layout_item.layout, self, accepts_drop=False)
-        self._preview.setEnabled(False)
-        self._preview.setFixedSize(180, 110)
+        self._preview = QLabel(self)
+        self._preview.setFixedSize(LAYOUT_CARD_PREVIEW_SIZE)
+        self._refresh_preview()
 
         self._title = QLabel(layout_item.title, self)
         self._title.setObjectName("LayoutPreviewCardTitle")
@@ -536,31 +756,45 @@ class LayoutPreviewCard(QFrame):
         wrapper.addWidget(self._title)
         wrapper.addWidget(self._subtitle)
 
-        self._apply_styles()
+        self.setProperty("selected", "false")
+        self.setStyleSheet(
+            """
+            QFrame#LayoutPreviewCard {
+                border: 1px solid rgba(255,255,255,0.25);
+                border-radius: 8px;
+                background-color: transparent;
+            }
+            QFrame#LayoutPreviewCard[selected="true"] {
+                border-color: #7fb0ff;
+            }
+            """
+        )
 
     def setSelected(self, selected: bool) -> None:
         if self._selected == selected:
             return
         self._selected = selected
-        self._apply_styles()
+        self.setProperty("selected", "true" if selected else "false")
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+        self.update()
+
+    def _refresh_preview(self) -> None:
+        pixmap = render_layout_thumbnail(self.layout_item.layout, LAYOUT_CARD_PREVIEW_SIZE, LayoutPreviewCanvas)
+        # Palette changes usually resolve to the same cached thumbnail; avoid a relayout then.
+        if pixmap.cacheKey() != self._preview.pixmap().cacheKey():
+            self._preview.setPixmap(pixmap)
 
     # ------------------------------------------------------------------ #
     # QWidget overrides
     # ------------------------------------------------------------------ #
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        if event.type() == QEvent.Type.PaletteChange:
+            self._refresh_preview()
+        super().changeEvent(event)
+
     def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
         if event.button() == Qt.MouseButton.LeftButton:
             self.clicked.emit(self.layout_item)
         super().mouseReleaseEvent(event)
-
-    # ------------------------------------------------------------------ #
-    # Helpers
-    # ------------------------------------------------------------------ #
-    def _apply_styles(self) -> None:
-        border = "#7fb0ff" if self._selected else "rgba(255,255,255,0.25)"
-        self.setStyleSheet(
-            f"QFrame#LayoutPreviewCard {{"
-            f"border: 1px solid {border};"
-            f"border-radius: 8px;"
-            f"background-color: transparent;"
-            f"}}"
-        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from PySide6.QtCore import Qt, QMimeData, Signal
-from PySide6.QtGui import QDrag, QDragEnterEvent, QDragMoveEvent, QDropEvent, QPixmap
+from PySide6.QtGui import QDrag, QDragEnterEvent, QDragMoveEvent, QDropEvent, QPainter, QPaintEvent, QPalette
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QFrame,
@@ -42,6 +42,9 @@ class PlaylistListWidget(QListWidget):
         self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.viewport().setAcceptDrops(True)
         self._drag_active_row: int | None = None
+        # Row the dragged item would be inserted before (count() = append); painted as a bar
+        # so the model is only reordered once, on drop.
+        self._drag_preview_row: int | None = None
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:  # type: ignore[override]
         if self._has_external_files(event.mimeData()):
@@ -65,6 +68,7 @@ class PlaylistListWidget(QListWidget):
 
     def dropEvent(self, event: QDropEvent) -> None:  # type: ignore[override]
         if event.source() == self and not self._has_external_files(event.mimeData()):
+            self._apply_drag_move()
             self._drag_active_row = None
             self.orderChanged.emit()
             event.acceptProposedAction()
@@ -90,46 +94,56 @@ class PlaylistListWidget(QListWidget):
         if item is not None:
             widget = self.itemWidget(item)
             if widget is not None:
-                pixmap = QPixmap(widget.size())
-                pixmap.fill(Qt.GlobalColor.transparent)
-                widget.render(pixmap)
-                drag.setPixmap(pixmap)
+                drag.setPixmap(widget.grab())
                 drag.setHotSpot(widget.rect().topLeft())
         self._drag_active_row = self.currentRow()
         drag.exec(supportedActions)
         self._drag_active_row = None
+        self._set_drag_preview_row(None)
         self.clearSelection()
 
     @staticmethod
     def _has_external_files(mime: QMimeData) -> bool:
-        return bool(mime.urls())
+        return mime.hasUrls()
 
     @staticmethod
     def _extract_files(mime: QMimeData) -> list[str]:
-        paths: list[str] = []
-        for url in mime.urls():
-            if url.isLocalFile():
-                paths.append(url.toLocalFile())
-        return paths
+        if not mime.hasUrls():
+            return []
+        return [url.toLocalFile() for url in mime.urls() if url.isLocalFile()]
 
     def _preview_drag_move(self, target_row: int) -> None:
-        if self._drag_active_row is None:
+        if self._drag_active_row is None or self.count() == 0:
             return
-        if target_row < 0:
-            target_row = 0
-        if target_row > self.count():
-            target_row = self.count()
-        if target_row == self._drag_active_row or self.count() == 0:
+        target_row = max(0, min(target_row, self.count()))
+        # Hovering a row below the dragged one places the item after it, above places it before.
+        if self._drag_active_row < target_row < self.count():
+            target_row += 1
+        if target_row in (self._drag_active_row, self._drag_active_row + 1):
+            self._set_drag_preview_row(None)
+            return
+        self._set_drag_preview_row(target_row)
+
+    def _set_drag_preview_row(self, row: int | None) -> None:
+        if row == self._drag_preview_row:
             return
+        self._drag_preview_row = row
+        self.viewport().update()
 
-        item = self.item(self._drag_active_row)
+    def _apply_drag_move(self) -> None:
+        source_row = self._drag_active_row
+        target_row = self._drag_preview_row
+        self._set_drag_preview_row(None)
+        if source_row is None or target_row is None:
+            return
+        item = self.item(source_row)
         if item is None:
             return
         widget = self.itemWidget(item)
         if widget is not None:
             self.removeItemWidget(item)
-        take = self.takeItem(self._drag_active_row)
-        if target_row > self._drag_active_row:
+        take = self.takeItem(source_row)
+        if target_row > source_row:
             target_row -= 1
         target_row = max(0, min(target_row, self.count()))
         self.insertItem(target_row, take)
@@ -138,6 +152,22 @@ class PlaylistListWidget(QListWidget):
         self._drag_active_row = target_row
         self.setCurrentRow(target_row)
 
+    def _drag_preview_y(self, row: int) -> int:
+        gap = self.spacing() // 2
+        if row < self.count():
+            return self.visualItemRect(self.item(row)).top() - gap
+        return self.visualItemRect(self.item(self.count() - 1)).bottom() + gap
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # type: ignore[override]
+        super().paintEvent(event)
+        row = self._drag_preview_row
+        if row is None or self.count() == 0:
+            return
+        y = self._drag_preview_y(row)
+        painter = QPainter(self.viewport())
+        painter.fillRect(0, y - 1, self.viewport().width(), 2, self.palette().color(QPalette.ColorRole.Highlight))
+        painter.end()
+
     def _autoscroll(self, point) -> None:
         margin = 24
         viewport = self.viewport()
@@ -1,13 +1,199 @@
 from __future__ import annotations
 
+import os
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Callable
 
-from PySide6.QtCore import QSize, Qt, QMimeData, QUrl, Signal, QPoint
-from PySide6.QtGui import QDrag, QIcon, QPixmap
-from PySide6.QtWidgets import QLabel, QAbstractItemView, QListWidget, QListWidgetItem
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QPoint,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    QMimeData,
+    QUrl,
+    Signal,
+)
+from PySide6.QtGui import QColor, QDrag, QIcon, QImage, QPixmap, QPixmapCache
+from PySide6.QtWidgets import QAbstractItemView, QListView, QStyledItemDelegate, QStyleOptionViewItem
 
+from slidequest.services.thumbnail_cache import load_thumbnail
 
-class ReplicateGalleryWidget(QListWidget):
+
+# Upper bound for the per-widget QIcon cache.
+ICON_CACHE_LIMIT = 512
+PLACEHOLDER_COLOR = QColor(128, 128, 128, 60)
+# Drag images only need to be recognisable, not full thumbnail size.
+DRAG_PIXMAP_SIZE = QSize(64, 64)
+
+
+def _thumbnail_cache_key(path: str, mtime: float, size: QSize) -> str:
+    # mtime is part of the key so regenerated files are decoded again.
+    return f"gallery:{path}:{mtime}:{size.width()}x{size.height()}"
+
+
+def _placeholder_pixmap(size: QSize) -> QPixmap:
+    key = f"gallery:placeholder:{size.width()}x{size.height()}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(size)
+        pixmap.fill(PLACEHOLDER_COLOR)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class _ThumbnailSignals(QObject):
+    loaded = Signal(str, str, QImage)
+
+
+class _ThumbnailRunnable(QRunnable):
+    """Loads one gallery thumbnail on a pool thread."""
+
+    def __init__(
+        self,
+        entry_id: str,
+        path: str,
+        mtime: float,
+        size: QSize,
+        cache_path: Path | None,
+        signals: _ThumbnailSignals,
+    ) -> None:
+        super().__init__()
+        self._entry_id = entry_id
+        self._path = path
+        self._mtime = mtime
+        self._size = QSize(size)
+        self._cache_path = cache_path
+        self._signals = signals
+
+    def run(self) -> None:  # type: ignore[override]
+        image = load_thumbnail(self._path, self._mtime, self._size, self._cache_path)
+        key = _thumbnail_cache_key(self._path, self._mtime, self._size)
+        self._signals.loaded.emit(self._entry_id, key, image)
+
+
+@dataclass
+class _GalleryRow:
+    entry_id: str
+    path: str
+    text: str
+    # QIcon for labelled galleries, bare QPixmap for the thumbnail delegate.
+    decoration: QIcon | QPixmap | None = None
+    # Thumbnail cache key the row shows or is waiting for.
+    thumbnail_key: str = ""
+
+
+class _GalleryModel(QAbstractListModel):
+    """Flat list model behind ReplicateGalleryWidget."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[_GalleryRow] = []
+        self._row_index: dict[str, int] = {}
+        self._size_hint = QSize()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row.text
+        if role == Qt.ItemDataRole.DecorationRole:
+            return row.decoration
+        if role == Qt.ItemDataRole.UserRole:
+            return row.entry_id
+        if role == Qt.ItemDataRole.UserRole + 1:
+            return row.path
+        if role == Qt.ItemDataRole.SizeHintRole:
+            return self._size_hint
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:  # type: ignore[override]
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+
+    def rows(self) -> list[_GalleryRow]:
+        return self._rows
+
+    def row_of(self, entry_id: str) -> int:
+        return self._row_index.get(entry_id, -1)
+
+    def reset_rows(self, rows: list[_GalleryRow], size_hint: QSize) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._size_hint = QSize(size_hint)
+        self._reindex()
+        self.endResetModel()
+
+    def update_rows(self, rows: list[_GalleryRow], size_hint: QSize, changed: set[str]) -> None:
+        """Move to ``rows`` with remove/insert/dataChanged signals so selection and current index survive."""
+        new_ids = [row.entry_id for row in rows]
+        keep = set(new_ids)
+        if size_hint != self._size_hint:
+            self.reset_rows(rows, size_hint)
+            return
+        # Remove bottom-up so the remaining indices stay valid.
+        for index in range(len(self._rows) - 1, -1, -1):
+            if self._rows[index].entry_id not in keep:
+                self.remove_row(index)
+        current = {row.entry_id for row in self._rows}
+        if [row.entry_id for row in self._rows] != [entry_id for entry_id in new_ids if entry_id in current]:
+            # Reordered entries cannot be expressed as inserts alone.
+            self.reset_rows(rows, size_hint)
+            return
+        for position, row in enumerate(rows):
+            if position < len(self._rows) and self._rows[position].entry_id == row.entry_id:
+                self._rows[position] = row
+                continue
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._rows.insert(position, row)
+            self.endInsertRows()
+            changed.discard(row.entry_id)
+        self._reindex()
+        for entry_id in changed:
+            self.row_changed(self.row_of(entry_id))
+
+    def row_changed(self, row: int) -> None:
+        if row < 0:
+            return
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def remove_row(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._reindex()
+        self.endRemoveRows()
+
+    def _reindex(self) -> None:
+        self._row_index = {row.entry_id: index for index, row in enumerate(self._rows)}
+
+
+class _ThumbnailDelegate(QStyledItemDelegate):
+    """Paints label-less gallery items as a bare thumbnail filling the item rect."""
+
+    def __init__(self, view: QListView) -> None:
+        super().__init__(view)
+        self._view = view
+
+    def paint(self, painter, option: QStyleOptionViewItem, index) -> None:  # type: ignore[override]
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(pixmap, QPixmap) and not pixmap.isNull():
+            painter.drawPixmap(option.rect, pixmap)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:  # type: ignore[override]
+        return self._view.iconSize()
+
+
+class ReplicateGalleryWidget(QListView):
     """Grid-based gallery for Replicate results with drag support."""
 
     entryActivated = Signal(str)
@@ -23,118 +209,185 @@ class ReplicateGalleryWidget(QListWidget):
     ) -> None:
         super().__init__(parent)
         self.setObjectName("ReplicateGalleryWidget")
-        self.setViewMode(QListWidget.ViewMode.IconMode)
-        self.setMovement(QListWidget.Movement.Static)
-        self.setResizeMode(QListWidget.ResizeMode.Adjust)
+        self._model = _GalleryModel(self)
+        self.setModel(self._model)
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.setDragEnabled(True)
         self.setAcceptDrops(False)
         self.setSpacing(6 if show_labels else 2)
+        # Every item's size hint is the icon size, so the view can skip per-item measuring.
+        self.setUniformItemSizes(True)
         self._thumb_size = thumbnail or QSize(120, 120)
         self.setIconSize(self._thumb_size)
-        self.itemActivated.connect(self._emit_activation)
+        self.activated.connect(self._emit_activation)
         self._entry_map: dict[str, dict[str, str]] = {}
+        # Icons per scaled pixmap cacheKey; kept across set_entries calls.
+        self._icon_cache: dict[int, QIcon] = {}
+        self._last_signature: tuple | None = None
+        self._thumbnail_path_for: Callable[[str, int, int], Path] | None = None
+        self._thumbnail_signals = _ThumbnailSignals()
+        self._thumbnail_signals.loaded.connect(self._on_thumbnail_loaded)
         self._show_labels = show_labels
+        if not show_labels:
+            self.setItemDelegate(_ThumbnailDelegate(self))
         if vertical:
-            self.setFlow(QListWidget.Flow.TopToBottom)
+            self.setFlow(QListView.Flow.TopToBottom)
             self.setWrapping(False)
         else:
-            self.setFlow(QListWidget.Flow.LeftToRight)
-        self.setStyleSheet(
-            """
-            QListWidget#ReplicateGalleryWidget {
-                background: transparent;
-                border: none;
-            }
-            QListWidget#ReplicateGalleryWidget::item {
-                color: rgba(255, 255, 255, 0.85);
-                border: none;
-                margin: 0px;
-                padding: 0px;
-            }
-            QListWidget#ReplicateGalleryWidget::item:selected {
-                border: 1px solid rgba(120, 190, 255, 0.9);
-                border-radius: 10px;
-            }
-            """
-        )
+            self.setFlow(QListView.Flow.LeftToRight)
 
     def setThumbnailSize(self, size: QSize) -> None:  # noqa: N802 - Qt naming consistency
         self.setIconSize(size)
 
-    def set_entries(self, entries: list[dict[str, str]], resolver: Callable[[str], str]) -> None:
-        self.clear()
-        self._entry_map.clear()
-        use_thumbnails = not self._show_labels
+    def set_entries(
+        self,
+        entries: list[dict[str, str]],
+        resolver: Callable[[str], str],
+        thumbnail_path: Callable[[str, int, int], Path] | None = None,
+    ) -> None:
+        """``thumbnail_path`` maps (absolute path, width, height) to an on-disk cache file, if any."""
+        self._thumbnail_path_for = thumbnail_path
+        rows: list[tuple[str, str, dict[str, str]]] = []
+        resolved: dict[str, str] = {}
         for entry in entries:
             entry_id = entry.get("id") or entry.get("path") or ""
             path = entry.get("path") or ""
             if not entry_id or not path:
                 continue
-            absolute = resolver(path)
-            if not absolute:
+            absolute = resolved.get(path)
+            if absolute is None:
+                absolute = resolved[path] = resolver(path)
+            if absolute:
+                rows.append((entry_id, absolute, entry))
+        # View models re-emit on unrelated changes; identical input keeps the current items.
+        size = self.iconSize()
+        signature = (
+            (size.width(), size.height()),
+            tuple((entry_id, absolute, entry.get("prompt")) for entry_id, absolute, entry in rows),
+        )
+        if signature == self._last_signature:
+            return
+        self._populate_entries(rows)
+        self._last_signature = signature
+
+    def clear(self) -> None:
+        self._last_signature = None
+        self._entry_map.clear()
+        self._model.reset_rows([], self.iconSize())
+
+    def _populate_entries(self, rows: list[tuple[str, str, dict[str, str]]]) -> None:
+        size = QSize(self.iconSize())
+        existing = {row.entry_id: row for row in self._model.rows()}
+        new_rows: list[_GalleryRow] = []
+        changed: set[str] = set()
+        self._entry_map = {}
+        pool = QThreadPool.globalInstance()
+        for entry_id, absolute, entry in rows:
+            if entry_id in self._entry_map:
                 continue
-            prompt = entry.get("prompt") or "Seedream-Ausgabe"
-            display_text = prompt.splitlines()[0][:42] if self._show_labels else ""
-            pixmap = QPixmap(absolute)
-            if pixmap.isNull():
+            try:
+                mtime = os.stat(absolute).st_mtime
+            except OSError:
                 continue
-            scaled = pixmap.scaled(
-                self.iconSize(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            icon = QIcon(scaled) if not use_thumbnails else QIcon()
-            item = QListWidgetItem(icon, display_text)
-            item.setData(Qt.ItemDataRole.UserRole, entry_id)
-            item.setData(Qt.ItemDataRole.UserRole + 1, absolute)
-            item.setSizeHint(QSize(self.iconSize().width(), self.iconSize().height()))
-            self.addItem(item)
-            if use_thumbnails:
-                label = QLabel()
-                label.setFixedSize(self.iconSize())
-                label.setPixmap(scaled)
-                label.setScaledContents(True)
-                label.setContentsMargins(0, 0, 0, 0)
-                self.setItemWidget(item, label)
+            prompt = entry.get("prompt") or "Seedream-Ausgabe"
+            text = prompt.splitlines()[0][:42] if self._show_labels else ""
+            # Rows are reused so unchanged entries keep their thumbnail without a reload.
+            row = existing.get(entry_id) or _GalleryRow(entry_id, absolute, text)
+            if row.path != absolute or row.text != text:
+                row.path = absolute
+                row.text = text
+                changed.add(entry_id)
+            key = _thumbnail_cache_key(absolute, mtime, size)
+            if row.thumbnail_key != key:
+                changed.add(entry_id)
+                row.thumbnail_key = key
+                scaled = QPixmapCache.find(key)
+                row.decoration = self._decoration_for(scaled or _placeholder_pixmap(size))
+                if scaled is None:
+                    cache_path = self._thumbnail_path_for(absolute, size.width(), size.height()) if self._thumbnail_path_for else None
+                    pool.start(_ThumbnailRunnable(entry_id, absolute, mtime, size, cache_path, self._thumbnail_signals))
+            new_rows.append(row)
             self._entry_map[entry_id] = entry
+        current_id = self.currentIndex().data(Qt.ItemDataRole.UserRole)
+        self._model.update_rows(new_rows, size, changed)
+        # Size changes and reorders fall back to a model reset; put the current entry back afterwards.
+        if isinstance(current_id, str) and not self.currentIndex().isValid():
+            row = self._model.row_of(current_id)
+            if row >= 0:
+                self.setCurrentIndex(self._model.index(row))
+
+    def _on_thumbnail_loaded(self, entry_id: str, key: str, image: QImage) -> None:
+        pixmap = QPixmap()
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(key, pixmap)
+        # Results for rows that were removed or now show another file are only cached.
+        index = self._model.row_of(entry_id)
+        if index < 0 or self._model.rows()[index].thumbnail_key != key:
+            return
+        if pixmap.isNull():
+            # Unreadable files are dropped, as they were before loading moved off-thread.
+            self._entry_map.pop(entry_id, None)
+            self._model.remove_row(index)
+            return
+        self._model.rows()[index].decoration = self._decoration_for(pixmap)
+        self._model.row_changed(index)
+
+    def _decoration_for(self, pixmap: QPixmap) -> QIcon | QPixmap:
+        return self._icon_for(pixmap) if self._show_labels else pixmap
+
+    def _icon_for(self, pixmap: QPixmap) -> QIcon:
+        key = pixmap.cacheKey()
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            if len(self._icon_cache) >= ICON_CACHE_LIMIT:
+                self._icon_cache.clear()
+            icon = QIcon(pixmap)
+            self._icon_cache[key] = icon
+        return icon
 
     def startDrag(self, supportedActions: Qt.DropActions) -> None:  # type: ignore[override]
-        item = self.currentItem()
-        if item is None:
+        index = self.currentIndex()
+        if not index.isValid():
             return
-        path = item.data(Qt.ItemDataRole.UserRole + 1)
+        path = index.data(Qt.ItemDataRole.UserRole + 1)
         if not isinstance(path, str) or not path:
             return
         mime = QMimeData()
         mime.setUrls([QUrl.fromLocalFile(path)])
         drag = QDrag(self)
         drag.setMimeData(mime)
-        pixmap = item.icon().pixmap(self.iconSize())
-        if pixmap.isNull() and isinstance(path, str):
-            source = QPixmap(path)
-            if not source.isNull():
-                pixmap = source.scaled(
-                    self.iconSize(),
-                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
+        pixmap = self._drag_pixmap(index, path)
         if not pixmap.isNull():
             drag.setPixmap(pixmap)
             drag.setHotSpot(pixmap.rect().center())
         drag.exec(supportedActions or Qt.DropAction.CopyAction)
 
-    def _emit_activation(self, item: QListWidgetItem) -> None:
-        entry_id = item.data(Qt.ItemDataRole.UserRole)
+    @staticmethod
+    def _drag_pixmap(index: QModelIndex, path: str) -> QPixmap:
+        decoration = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(decoration, QIcon):
+            return decoration.pixmap(DRAG_PIXMAP_SIZE)
+        source = decoration if isinstance(decoration, QPixmap) else QPixmap(path)
+        if source.isNull():
+            return source
+        # The drag image is transient and small, so nearest-neighbour scaling is enough.
+        return source.scaled(DRAG_PIXMAP_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
+
+    def _emit_activation(self, index: QModelIndex) -> None:
+        entry_id = index.data(Qt.ItemDataRole.UserRole)
         if isinstance(entry_id, str):
             self.entryActivated.emit(entry_id)
 
     def contextMenuEvent(self, event) -> None:  # type: ignore[override]
-        item = self.itemAt(event.pos())
-        if item is None:
+        index = self.indexAt(event.pos())
+        if not index.isValid():
             super().contextMenuEvent(event)
             return
-        entry_id = item.data(Qt.ItemDataRole.UserRole)
+        entry_id = index.data(Qt.ItemDataRole.UserRole)
         if isinstance(entry_id, str):
             self.entryContextRequested.emit(entry_id, event.globalPos())
             event.accept()
@@ -1,16 +1,90 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QSize, Signal
-from PySide6.QtGui import QFont, QPixmap, QIcon
-from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QToolButton, QVBoxLayout
+from functools import lru_cache
+
+from PySide6.QtCore import Qt, QRect, QSize, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPalette, QPixmap
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QSizePolicy, QSpacerItem, QToolButton, QVBoxLayout, QWidget
 
 from slidequest.ui.constants import ACTION_ICONS
+from slidequest.views.widgets.common import cached_icon
+
+PREVIEW_SIZE = QSize(96, 72)
+MOVE_BUTTON_SIZE = QSize(24, 24)
+PLACEHOLDER_COLOR = QColor("#333333")
+
+
+@lru_cache(maxsize=1)
+def _placeholder_preview() -> QPixmap:
+    """Single gray preview shared by every row until its real thumbnail is set."""
+    pixmap = QPixmap(PREVIEW_SIZE)
+    pixmap.fill(PLACEHOLDER_COLOR)
+    return pixmap
+
+
+@lru_cache(maxsize=4)
+def _item_fonts(base: str) -> tuple[QFont, QFont, QFont]:
+    """Title, subtitle and group fonts derived from the serialized base font, shared by all rows."""
+    base_font = QFont()
+    base_font.fromString(base)
+    title_font = QFont(base_font)
+    title_font.setPointSize(max(12, base_font.pointSize()))
+    title_font.setWeight(QFont.Weight.DemiBold)
+    group_font = QFont(base_font)
+    group_font.setPointSize(max(10, base_font.pointSize() - 2))
+    return title_font, QFont(base_font), group_font
+
+
+class _SlideItemText(QWidget):
+    """Paints title, subtitle and group in one widget instead of three labels."""
+
+    LINE_SPACING = 2
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("SlideItemText")
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self._fonts = _item_fonts(self.font().toString())
+        self._line_heights = tuple(QFontMetrics(font).height() for font in self._fonts)
+        self._lines: tuple[str, str, str] = ("", "", "")
+
+    def set_lines(self, title: str, subtitle: str, group: str) -> None:
+        lines = (title or "", subtitle or "", group or "")
+        if lines == self._lines:
+            return
+        self._lines = lines
+        self.update()
+
+    def lines(self) -> tuple[str, str, str]:
+        return self._lines
+
+    def sizeHint(self) -> QSize:  # type: ignore[override]
+        width = max(QFontMetrics(font).horizontalAdvance(text) for font, text in zip(self._fonts, self._lines))
+        height = sum(self._line_heights) + self.LINE_SPACING * (len(self._fonts) - 1)
+        return QSize(width, height)
+
+    def minimumSizeHint(self) -> QSize:  # type: ignore[override]
+        return QSize(0, self.sizeHint().height())
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        painter = QPainter(self)
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        width = self.width()
+        total = sum(self._line_heights) + self.LINE_SPACING * (len(self._fonts) - 1)
+        y = max(0, (self.height() - total) // 2)
+        for font, height, text in zip(self._fonts, self._line_heights, self._lines):
+            if text:
+                painter.setFont(font)
+                elided = QFontMetrics(font).elidedText(text, Qt.TextElideMode.ElideRight, width)
+                painter.drawText(QRect(0, y, width, height), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided)
+            y += height + self.LINE_SPACING
+        painter.end()
 
 
 class SlideListItemWidget(QFrame):
     moveRequested = Signal(object, int)
 
-    def __init__(self, slide, preview: QPixmap, parent=None) -> None:
+    def __init__(self, slide, preview: QPixmap | None = None, parent=None) -> None:
         super().__init__(parent)
         self.setObjectName("SlideListViewItem")
         self.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
@@ -22,73 +96,80 @@ class SlideListItemWidget(QFrame):
 
         self._preview = QLabel(self)
         self._preview.setObjectName("SlideItemPreview")
-        self._preview.setFixedSize(96, 72)
-        self._preview.setScaledContents(True)
-
-        text_layout = QVBoxLayout()
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(2)
+        self._preview.setFixedSize(PREVIEW_SIZE)
+        self._preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self._title = QLabel(self)
-        self._title.setObjectName("SlideItemTitle")
-        title_font = QFont(self._title.font())
-        title_font.setPointSize(max(12, title_font.pointSize()))
-        title_font.setWeight(QFont.Weight.DemiBold)
-        self._title.setFont(title_font)
-
-        self._subtitle = QLabel(self)
-        self._subtitle.setObjectName("SlideItemSubtitle")
-
-        self._group = QLabel(self)
-        self._group.setObjectName("SlideItemGroup")
-        group_font = QFont(self._group.font())
-        group_font.setPointSize(max(10, group_font.pointSize() - 2))
-        self._group.setFont(group_font)
-
-        text_layout.addWidget(self._title)
-        text_layout.addWidget(self._subtitle)
-        text_layout.addWidget(self._group)
+        self._text = _SlideItemText(self)
 
         layout.addWidget(self._preview)
-        layout.addLayout(text_layout, 1)
-
-        controls = QVBoxLayout()
-        controls.setContentsMargins(0, 0, 0, 0)
-        controls.setSpacing(4)
-
-        self._move_up = QToolButton(self)
-        self._move_up.setObjectName("SlideItemMoveUp")
-        self._move_up.setIcon(QIcon(str(ACTION_ICONS["move_up"])))
-        self._move_up.setIconSize(QSize(16, 16))
-        self._move_up.setAutoRaise(True)
-        self._move_up.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._move_up.setToolTip("Folie nach oben verschieben")
-        self._move_up.clicked.connect(lambda: self.moveRequested.emit(self._slide, -1))
-
-        self._move_down = QToolButton(self)
-        self._move_down.setObjectName("SlideItemMoveDown")
-        self._move_down.setIcon(QIcon(str(ACTION_ICONS["move_down"])))
-        self._move_down.setIconSize(QSize(16, 16))
-        self._move_down.setAutoRaise(True)
-        self._move_down.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._move_down.setToolTip("Folie nach unten verschieben")
-        self._move_down.clicked.connect(lambda: self.moveRequested.emit(self._slide, 1))
-
-        controls.addWidget(self._move_up)
-        controls.addWidget(self._move_down)
-        controls.addStretch(1)
-
-        layout.addLayout(controls)
+        layout.addWidget(self._text, 1)
+
+        # Move buttons are only built once the row is hovered; the spacer keeps the text width stable.
+        self._controls = QVBoxLayout()
+        self._controls.setContentsMargins(0, 0, 0, 0)
+        self._controls.setSpacing(4)
+        self._controls.addSpacerItem(
+            QSpacerItem(MOVE_BUTTON_SIZE.width(), 0, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
+        )
+        self._controls.addStretch(1)
+        self._move_up: QToolButton | None = None
+        self._move_down: QToolButton | None = None
+        self._move_enabled = (True, True)
+
+        layout.addLayout(self._controls)
 
         self.set_slide(slide, preview)
 
-    def set_slide(self, slide, preview: QPixmap) -> None:
+    def set_slide(self, slide, preview: QPixmap | None = None) -> None:
         self._slide = slide
-        self._title.setText(slide.title)
-        self._subtitle.setText(slide.subtitle)
-        self._group.setText(slide.group)
+        if preview is None or preview.isNull():
+            preview = _placeholder_preview()
+        self._text.set_lines(slide.title, slide.subtitle, slide.group)
+        # Fit once here so the label blits the pixmap instead of rescaling it on every paint.
+        if preview.width() > PREVIEW_SIZE.width() or preview.height() > PREVIEW_SIZE.height():
+            preview = preview.scaled(
+                PREVIEW_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+            )
         self._preview.setPixmap(preview)
 
+    def title(self) -> str:
+        return self._text.lines()[0]
+
     def set_move_enabled(self, up_enabled: bool, down_enabled: bool) -> None:
-        self._move_up.setEnabled(up_enabled)
-        self._move_down.setEnabled(down_enabled)
+        self._move_enabled = (up_enabled, down_enabled)
+        if self._move_up is not None and self._move_down is not None:
+            self._move_up.setEnabled(up_enabled)
+            self._move_down.setEnabled(down_enabled)
+
+    def enterEvent(self, event) -> None:  # type: ignore[override]
+        self._ensure_move_buttons()
+        self._move_up.show()
+        self._move_down.show()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event) -> None:  # type: ignore[override]
+        if self._move_up is not None and self._move_down is not None:
+            self._move_up.hide()
+            self._move_down.hide()
+        super().leaveEvent(event)
+
+    def _ensure_move_buttons(self) -> None:
+        if self._move_up is not None:
+            return
+        self._move_up = self._build_move_button("SlideItemMoveUp", "move_up", "Folie nach oben verschieben", -1)
+        self._move_down = self._build_move_button("SlideItemMoveDown", "move_down", "Folie nach unten verschieben", 1)
+        self._controls.insertWidget(0, self._move_up)
+        self._controls.insertWidget(1, self._move_down)
+        self.set_move_enabled(*self._move_enabled)
+
+    def _build_move_button(self, name: str, icon_key: str, tooltip: str, offset: int) -> QToolButton:
+        button = QToolButton(self)
+        button.setObjectName(name)
+        button.setIcon(cached_icon(str(ACTION_ICONS[icon_key])))
+        button.setIconSize(QSize(16, 16))
+        button.setFixedSize(MOVE_BUTTON_SIZE)
+        button.setAutoRaise(True)
+        button.setCursor(Qt.CursorShape.PointingHandCursor)
+        button.setToolTip(tooltip)
+        button.clicked.connect(lambda: self.moveRequested.emit(self._slide, offset))
+        return button
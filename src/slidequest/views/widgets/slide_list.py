@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import QListWidget
 
 from slidequest.views.widgets.playlist_list import PlaylistListWidget
@@ -9,6 +9,9 @@ from slidequest.views.widgets.playlist_list import PlaylistListWidget
 class SlideListWidget(PlaylistListWidget):
     """Explorer list widget that supports internal drag/drop reordering."""
 
+    # Inclusive row range currently inside the viewport; emitted after scrolling, resizing or repopulating.
+    visibleRowsChanged = Signal(int, int)
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setObjectName("SlideExplorerList")
@@ -17,6 +20,48 @@ class SlideListWidget(PlaylistListWidget):
         self.setSpacing(6)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        # Every row is the same item widget, so the view can reuse one size hint for the whole layout.
+        # Batched layout is avoided: item data changes restart it, collapsing the scroll range mid-scroll.
+        self.setUniformItemSizes(True)
+        self._visible_rows_timer = QTimer(self)
+        self._visible_rows_timer.setSingleShot(True)
+        self._visible_rows_timer.setInterval(0)
+        self._visible_rows_timer.timeout.connect(self._emit_visible_rows)
+        self.verticalScrollBar().valueChanged.connect(self.request_visible_rows)
+        # The range changes when a layout pass places the rows, so this also fires once they settle.
+        self.verticalScrollBar().rangeChanged.connect(self.request_visible_rows)
+        self.model().rowsInserted.connect(self.request_visible_rows)
+
+    def request_visible_rows(self, *_args) -> None:
+        self._visible_rows_timer.start()
+
+    def visible_rows(self) -> tuple[int, int] | None:
+        count = self.count()
+        if not count:
+            return None
+        first_rect = self.visualItemRect(self.item(0))
+        if not first_rect.isValid():
+            # Not laid out yet; the scroll range change of the layout pass requests again.
+            return None
+        if count == 1:
+            return 0, 0
+        # Uniform item sizes make every row one exact pitch below the previous one.
+        pitch = self.visualItemRect(self.item(1)).top() - first_rect.top()
+        if pitch <= 0:
+            return None
+        rect = self.viewport().rect()
+        first = (rect.top() - first_rect.top()) // pitch
+        last = (rect.bottom() - first_rect.top()) // pitch
+        return max(0, min(first, count - 1)), max(0, min(last, count - 1))
+
+    def _emit_visible_rows(self) -> None:
+        rows = self.visible_rows()
+        if rows is not None:
+            self.visibleRowsChanged.emit(*rows)
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self.request_visible_rows()
 
     @staticmethod
     def _has_external_files(_mime) -> bool:
@@ -1,19 +1,11 @@
 from __future__ import annotations
 
-from PySide6.QtWidgets import QApplication, QTextEdit
+from PySide6.QtWidgets import QTextEdit
 
 from slidequest.views.master.ai_prompt_binding import TextBinding
 
 
-def _ensure_app() -> QApplication:
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
-
-
 def test_text_binding_sync_and_write() -> None:
-    _ensure_app()
     editor = QTextEdit()
     state = {"value": "hello", "writes": []}
 
@@ -42,7 +34,6 @@ def test_text_binding_sync_and_write() -> None:
 
 
 def test_text_binding_on_change() -> None:
-    _ensure_app()
     editor = QTextEdit()
     events: list[str] = []
 
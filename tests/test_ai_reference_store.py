@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 import pytest
@@ -20,7 +21,7 @@ class _DummyProjectService:
         if src.name in self._fail_on:
             raise FileNotFoundError(file_path)
         dest = self._root / f"{bucket}-{src.name}"
-        dest.write_bytes(src.read_bytes())
+        shutil.copyfile(src, dest)
         return f"{bucket}/{dest.name}"
 
     def resolve_asset_path(self, asset_id: str) -> Path:
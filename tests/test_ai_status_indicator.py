@@ -1,19 +1,11 @@
 from __future__ import annotations
 
-from PySide6.QtWidgets import QApplication, QLabel
+from PySide6.QtWidgets import QLabel
 
 from slidequest.views.master.ai_status import AIStatusIndicator
 
 
-def _ensure_app() -> QApplication:
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
-
-
 def test_status_indicator_updates_label() -> None:
-    _ensure_app()
     indicator = AIStatusIndicator()
     label = QLabel()
     indicator.attach_label(label)
@@ -26,7 +18,6 @@ def test_status_indicator_updates_label() -> None:
 
 
 def test_status_indicator_callback_called() -> None:
-    _ensure_app()
     calls: list[str] = []
     indicator = AIStatusIndicator(on_change=calls.append)
     indicator.set_status("Hello")
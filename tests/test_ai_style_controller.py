@@ -1,17 +1,10 @@
 from __future__ import annotations
 
-from PySide6.QtWidgets import QApplication, QTextEdit, QToolButton
+from PySide6.QtWidgets import QTextEdit, QToolButton
 
 from slidequest.views.master.ai_style_controller import StylePromptController
 
 
-def _ensure_app() -> QApplication:
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
-
-
 class _DummyViewModel:
     def __init__(self, value: str = "") -> None:
         self._value = value
@@ -26,7 +19,6 @@ class _DummyViewModel:
 
 
 def test_style_prompt_controller_syncs_editor_and_toggle() -> None:
-    _ensure_app()
     editor = QTextEdit()
     toggle = QToolButton()
     toggle.setCheckable(True)
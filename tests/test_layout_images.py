@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QColor, QImage
+
+from slidequest.views.widgets.layout_images import decode_image
+
+
+def _write_image(tmp_path: Path, width: int, height: int) -> str:
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor("red"))
+    path = tmp_path / f"source_{width}x{height}.png"
+    assert image.save(str(path))
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    ("source", "cap"),
+    [
+        ((4000, 1000), QSize(1920, 1080)),
+        ((1000, 4000), QSize(1920, 1080)),
+        ((3000, 2000), QSize(1920, 1080)),
+        ((800, 600), QSize(1920, 1080)),
+        ((2000, 500), QSize(1920, 1080)),
+    ],
+)
+def test_decode_image_never_upscales(tmp_path: Path, source: tuple[int, int], cap: QSize) -> None:
+    width, height = source
+    image = decode_image(_write_image(tmp_path, width, height), cap)
+
+    assert not image.isNull()
+    assert image.width() <= width
+    assert image.height() <= height
+    # Downscaled sources still cover the cap, so cover-scaled areas lose no detail.
+    if image.size() != QSize(width, height):
+        assert image.width() >= cap.width() - 1
+        assert image.height() >= cap.height() - 1
+
+
+def test_decode_image_missing_file_is_null(tmp_path: Path) -> None:
+    assert decode_image(str(tmp_path / "missing.png"), QSize(100, 100)).isNull()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from slidequest.services.project_service import ProjectStorageService
+
+
+def test_move_to_trash_discards_cached_thumbnails(tmp_path: Path) -> None:
+    service = ProjectStorageService(project_id="demo", base_dir=tmp_path)
+    source = tmp_path / "render.png"
+    source.write_bytes(b"data")
+    relative = service.import_file("replicate", str(source))
+    absolute = str(service.resolve_asset_path(relative))
+
+    small = service.thumbnail_cache_path(absolute, 96, 54)
+    large = service.thumbnail_cache_path(relative, 192, 108)
+    assert small.parent == large.parent
+    assert service.thumbnail_cache_dir() in small.parents
+    for cached in (small, large):
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        cached.write_bytes(b"thumb")
+
+    service.move_to_trash(relative)
+
+    assert not small.exists()
+    assert not large.exists()
+    assert (service.trash_path() / relative).exists()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import Qt, QThreadPool
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication
+
+from slidequest.views.widgets.replicate_gallery import ReplicateGalleryWidget
+
+
+def _write_images(directory: Path, names: str) -> None:
+    for name in names:
+        image = QImage(80, 60, QImage.Format.Format_RGB32)
+        image.fill(QColor("red"))
+        assert image.save(str(directory / f"{name}.png"))
+
+
+def _entries(ids: str) -> list[dict[str, str]]:
+    return [{"id": entry_id, "path": f"{entry_id}.png", "prompt": "Prompt"} for entry_id in ids]
+
+
+def _settle() -> None:
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+
+def _ids(gallery: ReplicateGalleryWidget) -> list[str]:
+    model = gallery.model()
+    return [model.index(row).data(Qt.ItemDataRole.UserRole) for row in range(model.rowCount())]
+
+
+def _current_id(gallery: ReplicateGalleryWidget) -> str | None:
+    return gallery.currentIndex().data(Qt.ItemDataRole.UserRole)
+
+
+def _make_gallery(qtbot, tmp_path: Path) -> ReplicateGalleryWidget:
+    gallery = ReplicateGalleryWidget()
+    qtbot.addWidget(gallery)
+    _write_images(tmp_path, "abcde")
+    gallery.set_entries(_entries("abc"), lambda path: str(tmp_path / path))
+    _settle()
+    gallery.setCurrentIndex(gallery.model().index(1))
+    return gallery
+
+
+def test_insert_and_remove_keep_current_entry(qtbot, tmp_path: Path) -> None:
+    gallery = _make_gallery(qtbot, tmp_path)
+    resets: list[bool] = []
+    gallery.model().modelReset.connect(lambda: resets.append(True))
+
+    gallery.set_entries(_entries("eabcd"), lambda path: str(tmp_path / path))
+    _settle()
+    assert _ids(gallery) == list("eabcd")
+    assert _current_id(gallery) == "b"
+
+    gallery.set_entries(_entries("ebd"), lambda path: str(tmp_path / path))
+    _settle()
+    assert _ids(gallery) == list("ebd")
+    assert _current_id(gallery) == "b"
+    assert not resets
+
+
+def test_reorder_resets_and_restores_current_entry(qtbot, tmp_path: Path) -> None:
+    gallery = _make_gallery(qtbot, tmp_path)
+    resets: list[bool] = []
+    gallery.model().modelReset.connect(lambda: resets.append(True))
+
+    gallery.set_entries(_entries("cba"), lambda path: str(tmp_path / path))
+    _settle()
+
+    assert resets
+    assert _ids(gallery) == list("cba")
+    assert _current_id(gallery) == "b"
+
+
+def test_unreadable_file_is_dropped_when_its_thumbnail_arrives(qtbot, tmp_path: Path) -> None:
+    gallery = _make_gallery(qtbot, tmp_path)
+    (tmp_path / "broken.png").write_bytes(b"not an image")
+    entries = _entries("ab") + [{"id": "broken", "path": "broken.png", "prompt": "Prompt"}]
+
+    gallery.set_entries(entries, lambda path: str(tmp_path / path))
+    # The row shows a placeholder until the pool thread reports the failed decode.
+    assert "broken" in _ids(gallery)
+    _settle()
+
+    assert _ids(gallery) == ["a", "b"]
+    assert _current_id(gallery) == "b"
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from PySide6.QtWidgets import QApplication, QLabel, QToolButton
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QPointF
+from PySide6.QtWidgets import QApplication, QToolButton
+from PySide6.QtGui import QEnterEvent, QPixmap
 
 from slidequest.models.slide import (
     SlideAudioPayload,
@@ -12,13 +13,6 @@ from slidequest.models.slide import (
 from slidequest.views.widgets.slide_item_widget import SlideListItemWidget
 
 
-def _ensure_app() -> QApplication:
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
-
-
 def _make_slide(title: str = "Title", subtitle: str = "Sub", group: str = "Group") -> SlideData:
     layout = SlideLayoutPayload("1S|100/1R|100")
     audio = SlideAudioPayload()
@@ -27,7 +21,6 @@ def _make_slide(title: str = "Title", subtitle: str = "Sub", group: str = "Group
 
 
 def test_slide_item_widget_updates_content(qtbot) -> None:
-    _ensure_app()
     slide = _make_slide()
     pixmap = QPixmap(10, 10)
     widget = SlideListItemWidget(slide, pixmap)
@@ -35,11 +28,10 @@ def test_slide_item_widget_updates_content(qtbot) -> None:
 
     new_slide = _make_slide("New", "Sub2", "Group2")
     widget.set_slide(new_slide, pixmap)
-    assert widget.findChild(QLabel, "SlideItemTitle").text() == "New"
+    assert widget.title() == "New"
 
 
 def test_slide_item_widget_emits_move_requests(qtbot) -> None:
-    _ensure_app()
     slide = _make_slide()
     pixmap = QPixmap(10, 10)
     widget = SlideListItemWidget(slide, pixmap)
@@ -48,6 +40,9 @@ def test_slide_item_widget_emits_move_requests(qtbot) -> None:
     received = []
     widget.moveRequested.connect(lambda s, offset: received.append((s, offset)))
 
+    assert widget.findChild(QToolButton, "SlideItemMoveUp") is None
+    QApplication.sendEvent(widget, QEnterEvent(QPointF(), QPointF(), QPointF()))
+
     widget.findChild(QToolButton, "SlideItemMoveUp").click()
     widget.findChild(QToolButton, "SlideItemMoveDown").click()
 
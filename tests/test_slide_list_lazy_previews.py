@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QLabel, QListWidgetItem, QWidget
+
+from slidequest.models.slide import (
+    SlideAudioPayload,
+    SlideData,
+    SlideLayoutPayload,
+    SlideNotesPayload,
+)
+from slidequest.views.master.explorer_section import SLIDE_PREVIEW_LOADED_ROLE, ExplorerSectionMixin
+from slidequest.views.widgets.slide_list import SlideListWidget
+
+
+class _ExplorerHost(ExplorerSectionMixin):
+    def __init__(self, slide_list: SlideListWidget) -> None:
+        self._slide_list = slide_list
+        self.built: list[str] = []
+
+    def _update_slide_item_widget(self, widget: QWidget, slide: SlideData) -> None:
+        self.built.append(slide.title)
+
+
+def _make_slide(title: str) -> SlideData:
+    layout = SlideLayoutPayload("1S|100/1R|100")
+    return SlideData(title, "", "Group", layout=layout, audio=SlideAudioPayload(), notes=SlideNotesPayload())
+
+
+def _settle() -> None:
+    for _ in range(5):
+        QApplication.processEvents()
+
+
+def test_previews_load_only_for_visible_rows(qtbot) -> None:
+    slide_list = SlideListWidget()
+    qtbot.addWidget(slide_list)
+    slide_list.resize(260, 300)
+    host = _ExplorerHost(slide_list)
+    slide_list.visibleRowsChanged.connect(host._load_visible_slide_previews)
+    for index in range(60):
+        slide = _make_slide(f"Slide {index}")
+        widget = QLabel(slide.title)
+        widget.setFixedHeight(48)
+        item = QListWidgetItem()
+        item.setData(Qt.ItemDataRole.UserRole, slide)
+        item.setData(SLIDE_PREVIEW_LOADED_ROLE, False)
+        item.setSizeHint(widget.sizeHint())
+        slide_list.addItem(item)
+        slide_list.setItemWidget(item, widget)
+    slide_list.show()
+    _settle()
+
+    first, last = slide_list.visible_rows()
+    assert first == 0
+    assert 0 < last < 59
+    assert host.built == [f"Slide {row}" for row in range(first, last + 1)]
+
+    host.built.clear()
+    slide_list.scrollToBottom()
+    _settle()
+
+    first, last = slide_list.visible_rows()
+    assert last == 59
+    assert host.built == [f"Slide {row}" for row in range(first, last + 1)]
+    assert slide_list.item(30).data(SLIDE_PREVIEW_LOADED_ROLE) is False